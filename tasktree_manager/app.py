@@ -758,12 +758,15 @@ class TaskTreeApp(App):
         tasks = self.task_manager.list_tasks()
         all_worktrees = [wt for task in tasks for wt in task.worktrees]
         GitOps.update_all_worktree_statuses(all_worktrees)
+        # Task row labels / CLAUDE.md markers are disk reads too; do them here
+        # rather than on the UI thread while the list renders
+        row_states = {task.name: TaskList.row_state(task) for task in tasks}
         # Cancellation of thread workers is cooperative: when a newer refresh
         # superseded this one, applying our now-stale snapshot would overwrite
         # fresher UI state, so bail out instead.
         if get_current_worker().is_cancelled:
             return
-        self.call_from_thread(self._apply_refreshed_tasks, tasks, force_ui)
+        self.call_from_thread(self._apply_refreshed_tasks, tasks, force_ui, row_states=row_states)
 
     def _apply_refreshed_tasks(
         self,
@@ -771,6 +774,7 @@ class TaskTreeApp(App):
         force_ui: bool = False,
         select_task: str | None = None,
         select_worktree: str | None = None,
+        row_states: dict[str, tuple[str, bool]] | None = None,
     ) -> None:
         """Apply a (re)loaded task list to the UI (runs on the main thread).
 
@@ -814,7 +818,7 @@ class TaskTreeApp(App):
 
             if current_worktree_name:
                 self._preserved_worktree_name = current_worktree_name
-            task_list.load_tasks(tasks, preserve_selection=current_task_name)
+            task_list.load_tasks(tasks, preserve_selection=current_task_name, row_states=row_states)
 
             if not tasks:
                 # Last task disappeared - clear the dependent panels
@@ -1,6 +1,8 @@
 """Claude Code hook configuration for status monitoring."""
 
 import json
+import shlex
+import stat
 from pathlib import Path
 
 
@@ -34,23 +36,31 @@ def repo_memory_dir(repo_path: Path) -> Path:
     return Path.home() / ".claude" / "projects" / _encode_project_path(repo_path) / "memory"
 
 
-def _make_hook(status: str, status_file: str) -> dict:
-    """Create a single hook entry that writes status to the given file path."""
-    safe_path = status_file.replace("'", "'\\''")
+# Shell command each hook runs: (status, shell-quoted status file).
+# The timestamp comes from the shell's own $EPOCHSECONDS (bash 5+) when it
+# has one, sparing a fork+exec of date on every Claude event; shells
+# without it (dash, macOS bash 3.2) still fall back to date
+_HOOK_COMMAND = """printf '{"status":"%s","ts":%%d}' ${EPOCHSECONDS:-$(date +%%s)} > %s"""
+
+
+def _make_hook(status: str, quoted_path: str) -> dict:
+    """Create a single hook entry that writes status to the (quoted) file path."""
     return {
         "type": "command",
-        "command": f'printf \'{{"status":"{status}","ts":%d}}\' $(date +%s) > \'{safe_path}\'',
+        "command": _HOOK_COMMAND % (status, quoted_path),
         "async": True,
     }
 
 
 def _build_hooks_config(status_file: str) -> dict:
     """Build hooks config with absolute path to status file."""
+    # Quoted once for the shell, shared by all hooks
+    quoted_path = shlex.quote(status_file)
     return {
-        "SessionStart": [{"hooks": [_make_hook("running", status_file)]}],
-        "UserPromptSubmit": [{"hooks": [_make_hook("running", status_file)]}],
-        "Stop": [{"hooks": [_make_hook("waiting", status_file)]}],
-        "SessionEnd": [{"hooks": [_make_hook("ended", status_file)]}],
+        "SessionStart": [{"hooks": [_make_hook("running", quoted_path)]}],
+        "UserPromptSubmit": [{"hooks": [_make_hook("running", quoted_path)]}],
+        "Stop": [{"hooks": [_make_hook("waiting", quoted_path)]}],
+        "SessionEnd": [{"hooks": [_make_hook("ended", quoted_path)]}],
     }
 
 
@@ -58,12 +68,34 @@ def _load_settings(settings_file: Path) -> dict:
     """Read existing settings JSON, tolerating a missing or corrupt file."""
     if settings_file.exists():
         try:
-            return json.loads(settings_file.read_text())
-        except (json.JSONDecodeError, OSError):
+            return json.loads(settings_file.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
             return {}
     return {}
 
 
+def _write_settings(settings_file: Path, settings: dict) -> None:
+    """Write settings JSON atomically (temp file + rename).
+
+    Claude Code may read the file at any moment; a rename never exposes a
+    half-written document. A symlinked settings file (e.g. kept in a
+    dotfiles repo) is written through, keeping the link and the target's
+    permissions, and a failed write leaves no temp file behind.
+    """
+    data = (json.dumps(settings, indent=2) + "\n").encode()
+    target = settings_file.resolve()
+    tmp_file = target.with_name(target.name + ".tmp")
+    try:
+        tmp_file.write_bytes(data)
+        try:
+            tmp_file.chmod(stat.S_IMODE(target.stat().st_mode))
+        except FileNotFoundError:
+            pass  # new file: keep the umask default, as write_text would
+        tmp_file.replace(target)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+
 def _is_tasktree_hook_group(group: object) -> bool:
     """True if a hook group was written by tasktree (targets .claude_status)."""
     if not isinstance(group, dict):
@@ -116,16 +148,19 @@ def ensure_claude_hooks(task_path: Path, memory_dir: str = "") -> None:
 
     settings_file = claude_dir / "settings.local.json"
     existing = _load_settings(settings_file)
+    settings = dict(existing)
 
     # Merge hooks into existing settings, preserving user-defined groups
-    existing["hooks"] = _merge_hooks(
+    settings["hooks"] = _merge_hooks(
         existing.get("hooks"), _build_hooks_config(str(task_path / ".claude_status"))
     )
 
     if memory_dir:
-        existing["autoMemoryDirectory"] = str(Path(memory_dir).expanduser())
+        settings["autoMemoryDirectory"] = str(Path(memory_dir).expanduser())
 
-    settings_file.write_text(json.dumps(existing, indent=2) + "\n")
+    # Usually already up to date: hooks are re-ensured before every launch
+    if settings != existing:
+        _write_settings(settings_file, settings)
 
 
 def _exclude_settings_from_git(repo_path: Path) -> None:
@@ -169,10 +204,12 @@ def ensure_worktree_claude_settings(
 
     settings_file = claude_dir / "settings.local.json"
     existing = _load_settings(settings_file)
+    settings = dict(existing)
 
     # Merge, preserving user-defined hook groups (same policy as task hooks)
-    existing["hooks"] = _merge_hooks(existing.get("hooks"), _build_hooks_config(str(status_file)))
-    existing["autoMemoryDirectory"] = str(repo_memory_dir(repo_path))
+    settings["hooks"] = _merge_hooks(existing.get("hooks"), _build_hooks_config(str(status_file)))
+    settings["autoMemoryDirectory"] = str(repo_memory_dir(repo_path))
 
-    settings_file.write_text(json.dumps(existing, indent=2) + "\n")
+    if settings != existing:
+        _write_settings(settings_file, settings)
     _exclude_settings_from_git(repo_path)
@@ -1,6 +1,7 @@
 """Data models for tasktree-manager."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 
 
@@ -32,6 +33,13 @@ class Task:
     name: str
     path: Path
     worktrees: list[Worktree] = field(default_factory=list)
+    # Directory mtime captured while listing tasks (None: not captured yet)
+    mtime: float | None = None
+
+    @cached_property
+    def name_lower(self) -> str:
+        """Lowercased name for case-insensitive sorting, computed once."""
+        return self.name.lower()
 
     @property
     def is_dirty(self) -> bool:
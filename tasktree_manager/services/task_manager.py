@@ -4,9 +4,12 @@ import fnmatch
 import os
 import re
 import shutil
+import stat
+import string
 import subprocess
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from . import forge
@@ -14,8 +17,8 @@ from .claude_hooks import ensure_worktree_claude_settings
 from .config import Config
 from .models import RepoIssue, Task, TaskSafetyReport, Worktree
 
-# Task name validation pattern
-TASK_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9._/\-]+$")
+# Characters allowed in a task name
+TASK_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "._/-")
 
 
 def validate_task_name(name: str) -> str | None:
@@ -29,7 +32,7 @@ def validate_task_name(name: str) -> str | None:
         return "Task name cannot be empty"
     if name.startswith("-"):
         return "Task name cannot start with '-'"
-    if not TASK_NAME_PATTERN.match(name):
+    if not TASK_NAME_CHARS.issuperset(name):
         return "Task name can only contain letters, numbers, '.', '_', '/', '-'"
     parts = name.split("/")
     if "" in parts:
@@ -52,11 +55,67 @@ def validate_branch_name(branch: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=16)
+def _blocklist_regex(patterns: tuple[str, ...]) -> re.Pattern | None:
+    """Compile symlink blocklist globs into one regex (None when empty).
+
+    Same semantics as fnmatch.fnmatch per pattern (names and patterns go
+    through os.path.normcase), but one match call covers every pattern.
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns)
+    )
+
+
+def _mtime_ns(path: str) -> int | None:
+    """Modification time of ``path`` in ns, or None when it cannot be read."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _has_git_file(dirpath: str) -> bool:
+    """True when ``dirpath`` holds a ``.git`` that is not a directory."""
+    git_path = os.path.join(dirpath, ".git")
+    try:
+        return not stat.S_ISDIR(os.stat(git_path).st_mode)
+    except OSError:
+        # Missing, or a symlink whose target is gone
+        return os.path.islink(git_path)
+
+
+def _read_common_git_dir(worktree_path: Path) -> Path | None:
+    """The main repo's git dir for a linked worktree, read from disk.
+
+    Follows the worktree's ``.git`` file ("gitdir: <repo>/.git/worktrees/<id>")
+    and that admin dir's ``commondir`` file, as git itself does, which
+    spares spawning ``git rev-parse --git-common-dir``. Returns None for
+    anything else (no worktree, unexpected layout) so callers can ask git.
+    """
+    try:
+        pointer = (worktree_path / ".git").read_text(encoding="utf-8").strip()
+        if not pointer.startswith("gitdir: "):
+            return None
+        admin_dir = worktree_path / pointer[len("gitdir: ") :]
+        common = (admin_dir / "commondir").read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    common_dir = (admin_dir / common).resolve()
+    return common_dir if common_dir.is_dir() else None
+
+
 class TaskManager:
     """Manages tasks and worktrees."""
 
     def __init__(self, config: Config):
         self.config = config
+        # task path -> ([(scanned dir, mtime_ns)], [(worktree name, path)])
+        self._worktree_cache: dict[
+            Path, tuple[list[tuple[str, int | None]], list[tuple[str, Path]]]
+        ] = {}
 
     def _validate_task_name(self, name: str) -> None:
         """Validate task name for safety.
@@ -80,43 +139,83 @@ class TaskManager:
             return []
 
         tasks = []
-        for item in sorted(self.config.tasks_dir.iterdir()):
-            if item.is_dir() and not item.name.startswith("."):
-                task = Task(name=item.name, path=item)
-                task.worktrees = self._get_worktrees(task)
-                tasks.append(task)
+        # scandir entries answer is_dir() from the directory listing and keep
+        # the stat, so the mtime for date sorting comes along for one call
+        with os.scandir(self.config.tasks_dir) as entries:
+            task_entries = sorted(
+                (e for e in entries if not e.name.startswith(".") and e.is_dir()),
+                key=lambda e: e.name,
+            )
+        for entry in task_entries:
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                mtime = None
+            task = Task(name=entry.name, path=Path(entry.path), mtime=mtime)
+            task.worktrees = self._get_worktrees(task)
+            tasks.append(task)
         return tasks
 
     # Directories to skip when scanning for worktrees
     IGNORED_PATHS = {".terraform", "node_modules", "vendor", ".git"}
 
     def _get_worktrees(self, task: Task) -> list[Worktree]:
-        """Get all worktrees for a task (with directory pruning)."""
-        worktrees = []
+        """Get all worktrees for a task (with directory pruning).
+
+        A worktree is a directory holding a ``.git`` file. The scan stops at
+        each worktree instead of walking its checkout, and never enters
+        IGNORED_PATHS or symlinked directories.
+
+        Scans are cached per task: while every directory the last scan
+        listed keeps its mtime, no worktree can have been added or removed
+        under it, so a few stats replace the walk. Methods that add or
+        remove worktrees drop the entry themselves (mtime granularity).
+        """
+        cached = self._worktree_cache.get(task.path)
+        if cached is not None:
+            scanned, found = cached
+            if all(_mtime_ns(dirpath) == mtime for dirpath, mtime in scanned):
+                return [Worktree(name=name, path=path) for name, path in found]
+
         if not task.path.exists():
-            return worktrees
-
-        for dirpath, dirnames, filenames in os.walk(task.path):
-            # Prune ignored directories in-place
-            dirnames[:] = [d for d in dirnames if d not in self.IGNORED_PATHS]
-
-            # Check if this directory has .git (file or directory)
-            if ".git" in dirnames or ".git" in filenames:
-                worktree_path = Path(dirpath)
-                # Don't descend into .git directories
-                if ".git" in dirnames:
-                    dirnames[:] = [d for d in dirnames if d != ".git"]
-
-                try:
-                    rel_path = worktree_path.relative_to(task.path)
-                    # Skip the task root itself if it has .git
-                    if str(rel_path) == ".":
-                        continue
-                    worktrees.append(Worktree(name=str(rel_path), path=worktree_path))
-                except ValueError:
-                    continue
-
-        return sorted(worktrees, key=lambda w: w.name)
+            self._worktree_cache.pop(task.path, None)
+            return []
+
+        scanned = []
+        found = []
+        # (directory, its path relative to the task) still to scan
+        pending = [(str(task.path), "")]
+        while pending:
+            dirpath, rel_path = pending.pop()
+            # The task root itself is never a worktree, even with a .git. A
+            # worktree (usually every child of the root) costs one stat of
+            # its .git instead of listing its checkout's top level
+            if rel_path and _has_git_file(dirpath):
+                found.append((rel_path, Path(dirpath)))
+                continue
+
+            # Stat before listing: a change racing the scan shows up next time
+            mtime = _mtime_ns(dirpath)
+            try:
+                with os.scandir(dirpath) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            scanned.append((dirpath, mtime))
+            for entry in entries:
+                if entry.name not in self.IGNORED_PATHS and entry.is_dir(follow_symlinks=False):
+                    child = f"{rel_path}/{entry.name}" if rel_path else entry.name
+                    pending.append((entry.path, child))
+
+        found.sort()
+        self._worktree_cache[task.path] = (scanned, found)
+        # Fresh objects every call: callers update worktree status in place
+        return [Worktree(name=name, path=path) for name, path in found]
+
+    def _forget_worktrees(self, task: Task) -> None:
+        """Drop the cached worktree scan of a task whose worktrees changed."""
+        self._worktree_cache.pop(task.path, None)
 
     def get_task(self, name: str) -> Task | None:
         """Get a specific task by name."""
@@ -138,9 +237,20 @@ class TaskManager:
 
         task = Task(name=name, path=task_path)
 
-        for repo_name in repos:
-            self._create_worktree(task, repo_name, base_branch)
-
+        if repos:
+            # Each repo's setup (fetch, worktree add, symlinks) touches only
+            # its own source repo and worktree path, so repos are set up
+            # concurrently. Every repo is attempted; the first failure in
+            # request order is raised once all have finished.
+            with ThreadPoolExecutor(max_workers=min(8, len(repos))) as executor:
+                futures = [
+                    executor.submit(self._create_worktree, task, repo_name, base_branch)
+                    for repo_name in repos
+                ]
+            for future in futures:
+                future.result()
+
+        self._forget_worktrees(task)
         task.worktrees = self._get_worktrees(task)
         return task
 
@@ -162,53 +272,40 @@ class TaskManager:
         # Ensure parent directory exists for nested repos
         worktree_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check if branch already exists
-        branch_check = subprocess.run(
-            ["git", "rev-parse", "--verify", f"refs/heads/{task.name}"],
-            cwd=repo_path,
-            capture_output=True,
-            timeout=10,
-        )
-
-        # Use -B to reset branch if it exists, -b if it doesn't
-        branch_flag = "-B" if branch_check.returncode == 0 else "-b"
-
         # Fetch the base branch and base the worktree on the remote-tracking
         # ref directly. The local base branch is not trustworthy: the main
         # checkout may sit on another branch or be behind origin, and pulling
         # it (the old approach) silently did nothing in those cases, creating
         # worktrees from stale code. Falls back to the local branch when the
-        # fetch fails (offline, or a repo without an "origin" remote).
+        # fetch fails (offline, or a repo without an "origin" remote). The
+        # explicit refspec writes origin/<base> whatever the remote's
+        # configured refspecs, so a successful fetch means it exists.
         network_timeout = self.config.git_timeout
         fetch = subprocess.run(
-            ["git", "fetch", "origin", base_branch],
+            [
+                "git",
+                "fetch",
+                "origin",
+                f"+refs/heads/{base_branch}:refs/remotes/origin/{base_branch}",
+            ],
             cwd=repo_path,
             capture_output=True,
             text=True,
             timeout=network_timeout,
         )
+        start_point = f"origin/{base_branch}" if fetch.returncode == 0 else base_branch
 
-        start_point = base_branch
-        if fetch.returncode == 0:
-            remote_ref = subprocess.run(
-                ["git", "rev-parse", "--verify", f"refs/remotes/origin/{base_branch}"],
-                cwd=repo_path,
-                capture_output=True,
-                timeout=10,
-            )
-            if remote_ref.returncode == 0:
-                start_point = f"origin/{base_branch}"
-
-        # Create git worktree with task name as branch. --no-track keeps the
-        # task branch from tracking origin/<base>; push sets its own upstream
-        # (git push -u origin HEAD).
+        # Create git worktree with task name as branch. -B creates the branch,
+        # or resets it when it already exists, with no separate existence
+        # check. --no-track keeps the task branch from tracking origin/<base>;
+        # push sets its own upstream (git push -u origin HEAD).
         result = subprocess.run(
             [
                 "git",
                 "worktree",
                 "add",
                 "--no-track",
-                branch_flag,
+                "-B",
                 task.name,
                 str(worktree_path),
                 start_point,
@@ -286,7 +383,8 @@ class TaskManager:
         Returns:
             True if the filename matches any blocklist pattern
         """
-        return any(fnmatch.fnmatch(filename, pattern) for pattern in blocklist)
+        regex = _blocklist_regex(tuple(blocklist))
+        return regex is not None and regex.match(os.path.normcase(filename)) is not None
 
     def _create_gitignore_symlinks(self, source_repo: Path, worktree_path: Path) -> None:
         """Create symlinks for gitignored files from source repo to worktree.
@@ -304,38 +402,49 @@ class TaskManager:
         blocklist = self.config.symlink_blocklist
 
         for rel_name in self._list_gitignored_files(source_repo):
-            match = source_repo / rel_name
-            if not match.is_file():
-                continue
+            # Name-only filters first: they are free, is_file() is a stat
             rel_path = Path(rel_name)
             if ".git" in rel_path.parts or ".claude" in rel_path.parts:
                 continue
             # Skip files matching the blocklist, by filename or by
             # repo-relative path (so patterns like "secrets/*" work too)
-            if self._matches_blocklist(match.name, blocklist) or self._matches_blocklist(
+            if self._matches_blocklist(rel_path.name, blocklist) or self._matches_blocklist(
                 rel_name, blocklist
             ):
                 continue
+            match = source_repo / rel_path
+            if not match.is_file():
+                continue
             link_path = worktree_path / rel_path
-            # is_symlink() check catches broken symlinks, for which
-            # exists() returns False but symlink_to() would still fail
-            if not (link_path.exists() or link_path.is_symlink()):
+            # lexists() is a single lstat that also sees broken symlinks,
+            # for which exists() returns False but symlink_to() would fail
+            if not os.path.lexists(link_path):
                 link_path.parent.mkdir(parents=True, exist_ok=True)
                 link_path.symlink_to(match)
 
     def add_repo_to_task(self, task: Task, repo_name: str, base_branch: str = "master") -> None:
         """Add a repo worktree to an existing task."""
         self._create_worktree(task, repo_name, base_branch)
+        self._forget_worktrees(task)
         task.worktrees = self._get_worktrees(task)
 
     def finish_task(self, task: Task) -> None:
         """Finish/delete a task and clean up worktrees."""
-        for worktree in task.worktrees:
-            self._remove_worktree(worktree, task.name)
+        if task.worktrees:
+            # Each worktree belongs to a different main repo, so their git
+            # cleanups do not contend and run concurrently
+            with ThreadPoolExecutor(max_workers=min(16, len(task.worktrees))) as executor:
+                futures = [
+                    executor.submit(self._remove_worktree, worktree, task.name)
+                    for worktree in task.worktrees
+                ]
+            for future in futures:
+                future.result()
 
         # Remove task directory
         if task.path.exists():
             shutil.rmtree(task.path)
+        self._forget_worktrees(task)
 
     def set_task_display_name(self, task: Task, display_name: str | None) -> None:
         """Set or clear the task's display alias (TUI label only).
@@ -379,7 +488,7 @@ class TaskManager:
             # release/1.0 task against the repo default would bloat the
             # archive or, with no default ref resolvable, silently drop
             # the committed work right before the branch is deleted
-            base_branch = GitOps.get_task_base(worktree, branch) or GitOps.get_default_branch(
+            base_branch = GitOps.get_task_base(worktree, branch) or self._get_default_branch(
                 worktree
             )
             branch_diff = GitOps.get_branch_diff(worktree, base_branch, label=worktree.name)
@@ -404,6 +513,29 @@ class TaskManager:
         archive_path.write_text("\n".join(header) + "\n\n" + content, encoding="utf-8")
         return archive_path
 
+    def _get_default_branch(self, worktree: Worktree) -> str:
+        """The repo's default branch, read from its origin/HEAD symref file.
+
+        Symrefs are never packed, so the file holds the answer git symbolic-ref
+        would give, without spawning it. Anything else (no origin/HEAD, an
+        unexpected layout) goes to GitOps.get_default_branch, whose fallbacks
+        are worked out afresh every time rather than reused.
+        """
+        from .git_ops import GitOps
+
+        common_dir = _read_common_git_dir(worktree.path)
+        if common_dir is not None:
+            try:
+                ref = (common_dir / "refs" / "remotes" / "origin" / "HEAD").read_text(
+                    encoding="utf-8"
+                )
+            except (OSError, UnicodeDecodeError):
+                ref = ""
+            branch = ref.strip().removeprefix("ref: refs/remotes/origin/")
+            if ref.startswith("ref: refs/remotes/origin/") and branch:
+                return branch
+        return GitOps.get_default_branch(worktree)
+
     def _remove_worktree(self, worktree: Worktree, branch_name: str) -> None:
         """Remove a worktree from its main repo.
 
@@ -413,8 +545,12 @@ class TaskManager:
         """
         main_repo = None
 
-        # Try to find main repo from the worktree itself (if it exists and is valid)
-        if worktree.path.exists():
+        # Try to find main repo from the worktree itself (if it exists and is
+        # valid): its gitdir pointer first, git rev-parse if that is unusual
+        main_git_dir = _read_common_git_dir(worktree.path)
+        if main_git_dir is not None:
+            main_repo = main_git_dir.parent if main_git_dir.name == ".git" else main_git_dir
+        elif worktree.path.exists():
             try:
                 result = subprocess.run(
                     ["git", "rev-parse", "--path-format=absolute", "--git-common-dir"],
@@ -477,6 +613,7 @@ class TaskManager:
         self._remove_worktree(worktree, task.name)
         if worktree.path.exists():
             shutil.rmtree(worktree.path)
+        self._forget_worktrees(task)
         task.worktrees = self._get_worktrees(task)
 
     def get_repos_not_in_task(self, task: Task) -> list[str]:
@@ -549,7 +686,7 @@ class TaskManager:
                     )
                 )
 
-            default_branch = GitOps.get_default_branch(worktree)
+            default_branch = self._get_default_branch(worktree)
             if not GitOps.check_merged(worktree, default_branch):
                 # Squash/rebase merges are invisible to the ancestor check;
                 # ask the forge (glab/gh) before flagging the branch unmerged
@@ -591,7 +728,9 @@ class TaskManager:
 
             return issues
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        # Workers spend their time blocked on git (and forge) subprocesses,
+        # so every worktree gets its own thread instead of queueing behind 5
+        with ThreadPoolExecutor(max_workers=min(32, len(valid_worktrees))) as executor:
             futures = {executor.submit(_check_worktree, wt): wt for wt in valid_worktrees}
             for future in as_completed(futures):
                 for issue in future.result():
@@ -633,7 +772,7 @@ class TaskManager:
         if valid_worktrees:
             # Use parallel push for valid worktrees
             results = GitOps.push_all_parallel(
-                Task(name=task.name, path=task.path, worktrees=valid_worktrees)
+                Task(name=task.name, path=task.path, worktrees=valid_worktrees, mtime=task.mtime)
             )
             for name, success, _ in results:
                 if success:
@@ -1,6 +1,9 @@
 """Modal widgets for creating tasks and adding repos."""
 
-from typing import Any, ClassVar, TypeVar
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from rich.markup import escape
 from textual.app import ComposeResult
@@ -8,13 +11,24 @@ from textual.binding import Binding
 from textual.containers import Container, Horizontal
 from textual.message import Message
 from textual.screen import ModalScreen
-from textual.widgets import Button, Input, Label, SelectionList, Static
-from textual.widgets.selection_list import Selection
+from textual.widgets import Button, Input, Label, Static
 
 from ..services.task_manager import validate_branch_name, validate_task_name
 
+if TYPE_CHECKING:
+    from textual.timer import Timer
+    from textual.widgets import SelectionList
+
+# SelectionList (and its ToggleButton base) is the one widget family here that
+# Textual's app machinery does not already load, and only the repo pickers use
+# it — so it is imported where those build or query the list, keeping it off
+# app startup and the headless CLI path until a picker is first opened.
+
 T = TypeVar("T")
 
+# Modifier prefixes capitalized for display in the help screen
+_KEY_MODIFIER_RE = re.compile(r"(ctrl|shift|alt)\+")
+
 
 class ThemedModalScreen(ModalScreen[T]):
     """Base class for themed modal screens with typed dismiss results.
@@ -120,43 +134,80 @@ class ThemedModalScreen(ModalScreen[T]):
 class RepoFilterMixin:
     """Search-filter + selection tracking for a repo ``SelectionList``.
 
-    The repo list is rebuilt from scratch on every search keystroke, so the
+    The repo list is rebuilt from scratch whenever the search settles, so the
     selected state cannot live solely in the widget. ``selected_repos`` is the
     source of truth and this mixin keeps it in sync as the visible options
     change, so selections made before (or under) a previous search survive.
     """
 
+    # Seconds the search input must stay unchanged before the list is
+    # re-filtered, so a burst of keystrokes costs one rebuild, not one each
+    FILTER_DEBOUNCE: ClassVar[float] = 0.15
+
     available_repos: list[str]
     selected_repos: set[str]
 
-    def _reset_visible_repos(self) -> None:
-        """Mark every available repo as visible (no active filter)."""
+    def _init_repo_filter(self) -> None:
+        """Reset filter state: every available repo visible, nothing pending."""
         self._visible_repos: set[str] = set(self.available_repos)
+        self._filter_timer: Timer | None = None
+        # (repo, lowercased repo) pairs, lowered once here instead of on
+        # every keystroke
+        self._repo_keys: list[tuple[str, str]] = [
+            (repo, repo.lower()) for repo in self.available_repos
+        ]
+        # Last applied search term and its matches; a longer term containing
+        # it can only match a subset, so it is filtered from these instead
+        self._last_term = ""
+        self._last_matches: list[tuple[str, str]] = self._repo_keys
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes."""
+        """Re-filter the repo list once the search input settles."""
         if event.input.id == "repo-search":
-            self._filter_repos(event.value)
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            value = event.value
+            self._filter_timer = self.set_timer(
+                self.FILTER_DEBOUNCE, lambda: self._filter_repos(value)
+            )
 
     def _filter_repos(self, search_term: str) -> None:
         """Rebuild the repo list to show only repos matching ``search_term``."""
+        from textual.widgets import SelectionList
+        from textual.widgets.selection_list import Selection
+
         repo_list = self.query_one("#repo-list", SelectionList)
 
         # Case-insensitive substring match against the full repo path, so typing
         # a folder name like "mdp" shows every repo under that folder.
         search_lower = search_term.strip().lower()
+        if search_lower == self._last_term:
+            # Same normalized term (e.g. only whitespace changed): list is current
+            return
         if search_lower:
-            filtered = [repo for repo in self.available_repos if search_lower in repo.lower()]
+            # Narrowing the previous term only needs its matches re-checked
+            if self._last_term in search_lower:
+                candidates = self._last_matches
+            else:
+                candidates = self._repo_keys
+            matches = [key for key in candidates if search_lower in key[1]]
         else:
-            filtered = list(self.available_repos)
+            matches = self._repo_keys
+        filtered = [repo for repo, _ in matches]
+        self._last_term = search_lower
+        self._last_matches = matches
         self._visible_repos = set(filtered)
 
         # Clear and rebuild the list, restoring selection state from the
-        # source-of-truth set.
-        repo_list.clear_options()
-        for repo in filtered:
-            repo_list.add_option(
-                Selection(escape(repo), repo, initial_state=repo in self.selected_repos)
+        # source-of-truth set. One bulk add inside batch_update so the
+        # rebuild reaches the compositor as a single repaint.
+        with self.app.batch_update():
+            repo_list.clear_options()
+            repo_list.add_options(
+                [
+                    Selection(escape(repo), repo, initial_state=repo in self.selected_repos)
+                    for repo in filtered
+                ]
             )
 
     def on_selection_list_selected_changed(self, event: SelectionList.SelectedChanged) -> None:
@@ -167,8 +218,14 @@ class RepoFilterMixin:
         """
         if event.selection_list.id != "repo-list":
             return
-        selected_now = set(event.selection_list.selected)
-        self.selected_repos = (self.selected_repos - self._visible_repos) | selected_now
+        # Updated in place (no new sets per click): drop the visible repos,
+        # then re-add whichever of them the widget reports as selected
+        self.selected_repos.difference_update(self._visible_repos)
+        self.selected_repos.update(event.selection_list.selected)
+        self._on_repo_selection_changed()
+
+    def _on_repo_selection_changed(self) -> None:
+        """Hook run after ``selected_repos`` changes; modals override to react."""
 
 
 class CreateTaskModal(RepoFilterMixin, ThemedModalScreen[tuple[str, list[str], str] | None]):
@@ -180,6 +237,9 @@ class CreateTaskModal(RepoFilterMixin, ThemedModalScreen[tuple[str, list[str], s
     class TaskCreated(Message):
         """Message sent when a task is created."""
 
+        # Message itself is slotted; declaring ours keeps instances dict-free
+        __slots__ = ("name", "repos", "base_branch")
+
         def __init__(self, name: str, repos: list[str], base_branch: str):
             self.name = name
             self.repos = repos
@@ -200,9 +260,16 @@ class CreateTaskModal(RepoFilterMixin, ThemedModalScreen[tuple[str, list[str], s
         self.selected_repos: set[str] = set(initial_repos or [])
         self.initial_base_branch = initial_base_branch
         self.title_text = title
-        self._reset_visible_repos()
+        # Stripped input values, kept current by on_input_changed so the
+        # button gate and submit never re-read and re-strip the Inputs
+        self._task_name = ""
+        self._base_branch = initial_base_branch.strip() or "master"
+        self._init_repo_filter()
 
     def compose(self) -> ComposeResult:
+        from textual.widgets import SelectionList
+        from textual.widgets.selection_list import Selection
+
         with Container():
             yield Label(escape(self.title_text), classes="modal-title")
             yield Label("Task Name:", classes="section-label")
@@ -223,6 +290,31 @@ class CreateTaskModal(RepoFilterMixin, ThemedModalScreen[tuple[str, list[str], s
                 yield Button("Create", variant="primary", id="create-btn")
                 yield Button("Cancel", variant="default", id="cancel-btn")
 
+    def on_mount(self) -> None:
+        super().on_mount()
+        self._update_create_button()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Cache the stripped name/branch and re-gate the Create button."""
+        if event.input.id == "task-name":
+            self._task_name = event.value.strip()
+            self._update_create_button()
+        elif event.input.id == "base-branch":
+            self._base_branch = event.value.strip() or "master"
+
+    def _on_repo_selection_changed(self) -> None:
+        self._update_create_button()
+
+    def _update_create_button(self) -> None:
+        """Enable Create only once a name is typed and a repo is selected.
+
+        Gating the button up front means the common mistakes never reach
+        the error-toast path in ``_create_task``.
+        """
+        self.query_one("#create-btn", Button).disabled = not (
+            self._task_name and self.selected_repos
+        )
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press."""
         if event.button.id == "cancel-btn":
@@ -232,14 +324,13 @@ class CreateTaskModal(RepoFilterMixin, ThemedModalScreen[tuple[str, list[str], s
 
     def _create_task(self) -> None:
         """Create the task and dismiss modal."""
-        name_input = self.query_one("#task-name", Input)
-        branch_input = self.query_one("#base-branch", Input)
-
-        name = name_input.value.strip()
-        base_branch = branch_input.value.strip() or "master"
-        selected_repos = list(self.selected_repos)
+        name = self._task_name
+        base_branch = self._base_branch
+        selected_repos = sorted(self.selected_repos)
 
-        # Same validation the TaskManager enforces, surfaced early in the UI
+        # Same validation the TaskManager enforces, surfaced early in the UI.
+        # Empty name / no repos are normally caught by the disabled Create
+        # button; the checks stay for direct callers.
         error = validate_task_name(name) or validate_branch_name(base_branch)
         if error:
             self.notify(error, severity="error")
@@ -263,9 +354,12 @@ class AddRepoModal(RepoFilterMixin, ThemedModalScreen[tuple[list[str], str] | No
         self.task_name = task_name
         self.available_repos = available_repos
         self.selected_repos: set[str] = set()
-        self._reset_visible_repos()
+        self._init_repo_filter()
 
     def compose(self) -> ComposeResult:
+        from textual.widgets import SelectionList
+        from textual.widgets.selection_list import Selection
+
         with Container():
             yield Label(escape(f"Add Repos to: {self.task_name}"), classes="modal-title")
             yield Label("Base Branch:", classes="section-label")
@@ -302,7 +396,7 @@ class AddRepoModal(RepoFilterMixin, ThemedModalScreen[tuple[list[str], str] | No
         branch_input = self.query_one("#base-branch", Input)
 
         base_branch = branch_input.value.strip() or "master"
-        selected_repos = list(self.selected_repos)
+        selected_repos = sorted(self.selected_repos)
 
         error = validate_branch_name(base_branch)
         if error:
@@ -324,9 +418,7 @@ class ConfirmModal(ThemedModalScreen[bool]):
 
     CANCEL_RESULT: ClassVar[bool] = False
 
-    DEFAULT_CSS = (
-        ThemedModalScreen.DEFAULT_CSS
-        + """
+    DEFAULT_CSS = """
     ConfirmModal > Container {
         width: 60;
         border: round $error;
@@ -336,7 +428,6 @@ class ConfirmModal(ThemedModalScreen[bool]):
         color: $text-error;
     }
     """
-    )
 
     def __init__(self, title: str, message: str, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -365,9 +456,7 @@ class SafeDeleteModal(ThemedModalScreen[str | None]):
     Dismisses with: "push", "lazygit", "force", or None if cancelled.
     """
 
-    DEFAULT_CSS = (
-        ThemedModalScreen.DEFAULT_CSS
-        + """
+    DEFAULT_CSS = """
     SafeDeleteModal > Container {
         width: 70;
         height: auto;
@@ -401,48 +490,43 @@ class SafeDeleteModal(ThemedModalScreen[str | None]):
         overflow-y: auto;
     }
     """
+
+    # (report attribute, section header) in display order
+    WARNING_SECTIONS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("errors", "[bold red]Status unreadable (state unknown):[/]"),
+        ("unpushed", "[bold red]Unpushed commits:[/]"),
+        ("unmerged", "[bold red]Unmerged branches:[/]"),
+        ("dirty", "[bold red]Uncommitted changes:[/]"),
+        ("merged_via_forge", "[bold green]Merged remotely (squash/rebase):[/]"),
     )
 
     def __init__(self, task_name: str, safety_report, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.task_name = task_name
         self.safety_report = safety_report
+        # The report is complete up front, so format it before mounting
+        self._warnings_content = self._build_warnings()
+
+    def _build_warnings(self) -> str:
+        """Format the safety report as markup, one section per issue type."""
+        # Fragments are joined once. Repo names are escaped because they come
+        # from the filesystem and may contain markup-significant brackets.
+        parts: list[str] = []
+        for attr, header in self.WARNING_SECTIONS:
+            # getattr: tolerate report objects predating the newer fields
+            issues = getattr(self.safety_report, attr, None)
+            if not issues:
+                continue
+            parts.append(f"\n{header}")
+            parts.extend(escape(f"  * {issue.repo_name} ({issue.details})") for issue in issues)
+        return "\n".join(parts).strip()
 
     def compose(self) -> ComposeResult:
         with Container():
             yield Label(escape(f"Delete Task: {self.task_name}"), classes="modal-title")
             yield Static("WARNING: Issues detected", classes="modal-message")
 
-            # Build warnings content (repo names are escaped: they come from
-            # the filesystem and may contain markup-significant brackets)
-            warnings_content = ""
-
-            if getattr(self.safety_report, "errors", None):
-                warnings_content += "\n[bold red]Status unreadable (state unknown):[/]\n"
-                for issue in self.safety_report.errors:
-                    warnings_content += escape(f"  * {issue.repo_name} ({issue.details})") + "\n"
-
-            if self.safety_report.has_unpushed():
-                warnings_content += "\n[bold red]Unpushed commits:[/]\n"
-                for issue in self.safety_report.unpushed:
-                    warnings_content += escape(f"  * {issue.repo_name} ({issue.details})") + "\n"
-
-            if self.safety_report.has_unmerged():
-                warnings_content += "\n[bold red]Unmerged branches:[/]\n"
-                for issue in self.safety_report.unmerged:
-                    warnings_content += escape(f"  * {issue.repo_name} ({issue.details})") + "\n"
-
-            if self.safety_report.has_dirty():
-                warnings_content += "\n[bold red]Uncommitted changes:[/]\n"
-                for issue in self.safety_report.dirty:
-                    warnings_content += escape(f"  * {issue.repo_name} ({issue.details})") + "\n"
-
-            if getattr(self.safety_report, "merged_via_forge", None):
-                warnings_content += "\n[bold green]Merged remotely (squash/rebase):[/]\n"
-                for issue in self.safety_report.merged_via_forge:
-                    warnings_content += escape(f"  * {issue.repo_name} ({issue.details})") + "\n"
-
-            yield Static(warnings_content.strip(), classes="scrollable-content")
+            yield Static(self._warnings_content, classes="scrollable-content")
 
             with Horizontal(classes="button-row"):
                 yield Button("Push All", variant="primary", id="push-btn")
@@ -554,14 +638,11 @@ class PushResultModal(ThemedModalScreen[None]):
     Dismisses with: None (informational only).
     """
 
-    DEFAULT_CSS = (
-        ThemedModalScreen.DEFAULT_CSS
-        + """
+    DEFAULT_CSS = """
     PushResultModal > Container {
         width: 60;
     }
     """
-    )
 
     def __init__(self, success_repos: list[str], failed_repos: list[str], *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -572,20 +653,18 @@ class PushResultModal(ThemedModalScreen[None]):
         with Container():
             yield Label("Push Results", classes="modal-title")
 
-            result_text = ""
+            parts: list[str] = []
             if self.success_repos:
-                result_text += "[bold green]Successfully pushed:[/]\n"
-                for repo in self.success_repos:
-                    result_text += f"  [green]✓[/] {escape(repo)}\n"
+                parts.append("[bold green]Successfully pushed:[/]")
+                parts.extend(f"  [green]✓[/] {escape(repo)}" for repo in self.success_repos)
 
             if self.failed_repos:
-                if result_text:
-                    result_text += "\n"
-                result_text += "[bold red]Failed to push:[/]\n"
-                for repo in self.failed_repos:
-                    result_text += f"  [red]✗[/] {escape(repo)}\n"
+                # Leading newline separates the sections; strip() drops it
+                # when there is no success section above
+                parts.append("\n[bold red]Failed to push:[/]")
+                parts.extend(f"  [red]✗[/] {escape(repo)}" for repo in self.failed_repos)
 
-            yield Static(result_text.strip(), classes="modal-message")
+            yield Static("\n".join(parts).strip(), classes="modal-message")
 
             with Horizontal(classes="button-row"):
                 yield Button("Close", variant="primary", id="close-btn")
@@ -601,9 +680,7 @@ class HelpModal(ThemedModalScreen[None]):
     Dismisses with: None (informational only).
     """
 
-    DEFAULT_CSS = (
-        ThemedModalScreen.DEFAULT_CSS
-        + """
+    DEFAULT_CSS = """
     HelpModal > Container {
         width: 70;
         max-height: 90%;
@@ -647,7 +724,9 @@ class HelpModal(ThemedModalScreen[None]):
         overflow-y: auto;
     }
     """
-    )
+
+    # Help text keyed by keybinding set; action_help builds a fresh modal per open.
+    _help_cache: ClassVar[dict[frozenset[tuple[str, str]], str]] = {}
 
     def __init__(
         self, keybindings: dict[str, str] | None = None, config_path: str = "", *args, **kwargs
@@ -666,8 +745,7 @@ class HelpModal(ThemedModalScreen[None]):
         """Get the keybinding for an action, with formatting."""
         key = self.keybindings.get(action, default)
         # Format special keys for display
-        key = key.replace("ctrl+", "Ctrl+").replace("shift+", "Shift+").replace("alt+", "Alt+")
-        return key
+        return _KEY_MODIFIER_RE.sub(lambda m: m.group(1).capitalize() + "+", key)
 
     def _format_binding(self, action: str, default: str, description: str) -> str:
         """Format a single keybinding line."""
@@ -680,7 +758,7 @@ class HelpModal(ThemedModalScreen[None]):
             yield Label("tasktree-manager Help", classes="modal-title")
 
             # Build help content with actual keybindings
-            help_content = self._build_help_content()
+            help_content = self._cached_help_content()
 
             with Container(classes="scrollable-help"):
                 yield Static(help_content, classes="help-text")
@@ -692,6 +770,14 @@ class HelpModal(ThemedModalScreen[None]):
             with Horizontal(classes="button-row"):
                 yield Button("Close", variant="primary", id="close-btn")
 
+    def _cached_help_content(self) -> str:
+        """Return help content, building it only for unseen keybinding sets."""
+        cache_key = frozenset(self.keybindings.items())
+        content = self._help_cache.get(cache_key)
+        if content is None:
+            content = self._help_cache[cache_key] = self._build_help_content()
+        return content
+
     def _build_help_content(self) -> str:
         """Build the help content with current keybindings."""
         sections = []
@@ -1,8 +1,10 @@
 """Messages panel widget for displaying activity log."""
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from typing import ClassVar
 
 from rich.text import Text
 from textual.widgets import Static
@@ -44,13 +46,15 @@ class MessagesStore:
     """Store for activity messages with max capacity."""
 
     max_messages: int = 100
-    messages: list[ActivityMessage] = field(default_factory=list)
+    messages: deque[ActivityMessage] = field(default_factory=deque)
+
+    def __post_init__(self) -> None:
+        # A bounded deque evicts the oldest entry in O(1) on append
+        self.messages = deque(self.messages, maxlen=self.max_messages)
 
     def add(self, message: ActivityMessage) -> None:
         """Add a message, removing oldest if at capacity."""
         self.messages.append(message)
-        if len(self.messages) > self.max_messages:
-            self.messages.pop(0)
 
     def clear(self) -> None:
         """Clear all messages."""
@@ -75,6 +79,9 @@ class MessagesPanel(Static):
         MessageLevel.ERROR: "ERROR",
     }
 
+    # Shown when the log is empty; never mutated, so one instance is shared
+    _EMPTY_TEXT: ClassVar[Text] = Text("No recent activity", style="dim")
+
     def __init__(self, max_messages: int = 100, *args, **kwargs):
         """Initialize the messages panel.
 
@@ -83,6 +90,11 @@ class MessagesPanel(Static):
         """
         super().__init__(*args, **kwargs)
         self._store = MessagesStore(max_messages=max_messages)
+        # Rendered lines, newest first. Each message is formatted once when
+        # added; the bounded deque drops the oldest line as the store does.
+        self._lines: deque[Text] = deque(maxlen=max_messages)
+        # Set when lines changed while the panel was off screen
+        self._dirty = False
 
     def add_message(self, message: str, level: MessageLevel, task_name: str | None = None) -> None:
         """Add a new message to the activity log.
@@ -94,38 +106,53 @@ class MessagesPanel(Static):
         """
         activity_msg = ActivityMessage.create(message, level, task_name)
         self._store.add(activity_msg)
-        self._update_display()
+        self._lines.appendleft(self._format_message(activity_msg))
+        self._refresh_if_shown()
 
     def clear_messages(self) -> None:
         """Clear all messages from the activity log."""
         self._store.clear()
-        self._update_display()
+        self._lines.clear()
+        self._refresh_if_shown()
 
-    def _update_display(self) -> None:
-        """Update the panel display with current messages."""
-        if not self._store.messages:
-            self.update(Text("No recent activity", style="dim"))
+    def _refresh_if_shown(self) -> None:
+        """Render now if on screen, otherwise defer until the panel is shown.
+
+        The panel sits hidden behind the status panel until toggled, so
+        background operations would otherwise re-join the log for nothing.
+        """
+        if not self.is_on_screen:
+            self._dirty = True
             return
+        self._update_display()
 
-        # Build Rich Text with colored output
-        text = Text()
+    def on_show(self) -> None:
+        """Flush lines logged while the panel was hidden."""
+        if self._dirty:
+            self._update_display()
 
-        # Show messages in reverse order (newest first)
-        for i, msg in enumerate(reversed(self._store.messages)):
-            if i > 0:
-                text.append("\n")
+    def _format_message(self, msg: ActivityMessage) -> Text:
+        """Render one message as ``[HH:MM:SS] [LEVEL] message``."""
+        timestamp_str = msg.timestamp.strftime("%H:%M:%S")
+        level_color = self.LEVEL_COLORS.get(msg.level, "white")
+        level_label = self.LEVEL_LABELS.get(msg.level, "INFO")
 
-            # Format: [HH:MM:SS] [LEVEL] message
-            timestamp_str = msg.timestamp.strftime("%H:%M:%S")
-            level_color = self.LEVEL_COLORS.get(msg.level, "white")
-            level_label = self.LEVEL_LABELS.get(msg.level, "INFO")
+        text = Text()
+        text.append(f"[{timestamp_str}] ", style="dim")
+        text.append(f"[{level_label}]", style=f"bold {level_color}")
+        text.append(" ")
+        text.append(msg.message)
+        return text
 
-            text.append(f"[{timestamp_str}] ", style="dim")
-            text.append(f"[{level_label}]", style=f"bold {level_color}")
-            text.append(" ")
-            text.append(msg.message)
+    def _update_display(self) -> None:
+        """Update the panel display with current messages (newest first)."""
+        self._dirty = False
+        if not self._lines:
+            self.update(self._EMPTY_TEXT)
+            return
 
-        self.update(text)
+        # Lines are already rendered; only the join is left per update
+        self.update(Text("\n").join(self._lines))
 
     @property
     def message_count(self) -> int:
@@ -1,12 +1,24 @@
 """Setup wizard for first-time configuration."""
 
+import os
+import stat
 from pathlib import Path
 
+from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Static
+from textual.worker import get_current_worker
+
+
+def _stat_mode(path: Path) -> int | None:
+    """st_mode of ``path``, or None when it cannot be reached."""
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
 
 
 class SetupModal(ModalScreen[tuple[Path, Path] | None]):
@@ -84,6 +96,7 @@ class SetupModal(ModalScreen[tuple[Path, Path] | None]):
         color: $text-error;
         text-align: center;
         margin-top: 1;
+        display: none;
     }
     """
 
@@ -128,8 +141,8 @@ These settings will be saved to ~/.config/tasktree-manager/config.toml
                 id="tasks-dir",
             )
 
-            if self.error_message:
-                yield Static(self.error_message, classes="error-message")
+            # Always present so validation errors update it in place
+            yield Static(self.error_message, id="error-message", classes="error-message")
 
             with Horizontal(classes="button-row"):
                 yield Button("Save & Continue", variant="primary", id="save-btn")
@@ -143,27 +156,40 @@ These settings will be saved to ~/.config/tasktree-manager/config.toml
             self._save_config()
 
     def _save_config(self) -> None:
-        """Validate and save configuration."""
+        """Read the inputs and validate them off the UI thread."""
         repos_input = self.query_one("#repos-dir", Input)
         tasks_input = self.query_one("#tasks-dir", Input)
 
         repos_dir = Path(repos_input.value.strip()).expanduser()
         tasks_dir = Path(tasks_input.value.strip()).expanduser()
+        self._validate_paths(repos_dir, tasks_dir)
 
-        # Validate
+    @work(thread=True, exclusive=True, group="setup_validate")
+    def _validate_paths(self, repos_dir: Path, tasks_dir: Path) -> None:
+        """Stat the chosen directories in a worker (slow on network mounts)."""
         errors = []
 
-        if not repos_dir.exists():
+        # One stat per path answers both "exists" and "is a directory"
+        repos_mode = _stat_mode(repos_dir)
+        if repos_mode is None:
             errors.append(f"Repositories directory does not exist: {repos_dir}")
-        elif not repos_dir.is_dir():
+        elif not stat.S_ISDIR(repos_mode):
             errors.append(f"Repositories path is not a directory: {repos_dir}")
 
-        if not tasks_dir.parent.exists():
+        if _stat_mode(tasks_dir.parent) is None:
             errors.append(f"Parent directory does not exist: {tasks_dir.parent}")
 
+        if get_current_worker().is_cancelled:
+            return
+        self.app.call_from_thread(self._apply_validation, repos_dir, tasks_dir, errors)
+
+    def _apply_validation(self, repos_dir: Path, tasks_dir: Path, errors: list[str]) -> None:
+        """Show validation errors in place, or save and dismiss."""
         if errors:
             self.error_message = "\n".join(errors)
-            self.refresh(recompose=True)
+            error_widget = self.query_one("#error-message", Static)
+            error_widget.update(self.error_message)
+            error_widget.display = True
             return
 
         # Save and dismiss
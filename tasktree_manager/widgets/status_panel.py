@@ -1,27 +1,88 @@
 """Status panel widget for tasktree-manager."""
 
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, ClassVar
+
+from rich.style import Style
 from rich.text import Text
 from textual.widgets import Static
 
 from ..services.models import GitStatus, Task, Worktree
 
+if TYPE_CHECKING:
+    from textual.timer import Timer
+
+# Parsed once at import; every render reuses these instead of style strings
+_LABEL = Style(color="cyan")
+_GREEN = Style(color="green")
+_YELLOW = Style(color="yellow")
+_RED = Style(color="red")
+_BOLD_RED = Style(color="red", bold=True)
+_BOLD = Style(bold=True)
+_DIM = Style(dim=True)
+_DIM_ITALIC = Style(dim=True, italic=True)
+_PLAIN = Style()
+
 
-def _style_for_code(status_code: str) -> str:
+def _classify_code(status_code: str) -> Style:
     """Pick a display style for a git XY status code."""
     if "U" in status_code or status_code in ("AA", "DD"):
-        return "bold red"  # merge conflicts
+        return _BOLD_RED  # merge conflicts
     if status_code.strip().startswith("?"):
-        return "red"  # untracked
+        return _RED  # untracked
     if "D" in status_code:
-        return "red"  # deletions
+        return _RED  # deletions
     if "M" in status_code or "T" in status_code:
-        return "yellow"  # modifications
-    return "green"  # additions, renames, copies
+        return _YELLOW  # modifications
+    return _GREEN  # additions, renames, copies
+
+
+def _styles_for(status_code: str) -> tuple[Style, Style]:
+    """(code style, filename style) — filenames are red alongside red codes."""
+    style = _classify_code(status_code)
+    return style, _RED if style.color == _RED.color else _PLAIN
+
+
+# Every XY pair git can emit, classified once so each rendered line is a
+# single dict lookup
+_CODE_CHARS = " MTADRCU?!"
+_CODE_STYLES: dict[str, tuple[Style, Style]] = {
+    x + y: _styles_for(x + y) for x in _CODE_CHARS for y in _CODE_CHARS
+}
+
+
+def _style_for_code(status_code: str) -> tuple[Style, Style]:
+    """Look up (code style, filename style) for a git XY status code."""
+    return _CODE_STYLES.get(status_code) or _styles_for(status_code)
+
+
+@lru_cache(maxsize=64)
+def _clean_worktree_text(name: str, branch: str) -> Text:
+    """The view for a clean, in-sync worktree — by far the most common one.
+
+    Shared between renders (callers never mutate it), so moving between clean
+    worktrees reuses one Text per (name, branch) instead of rebuilding it.
+    """
+    return Text.assemble(
+        ("Repository: ", _LABEL),
+        f"{name}\n",
+        ("Branch: ", _LABEL),
+        (f"{branch}\n", _GREEN),
+        ("Sync:   ", _LABEL),
+        ("up to date\n", _DIM),
+        "\n",
+        ("working tree clean", _DIM),
+    )
 
 
 class StatusPanel(Static):
     """Panel displaying git status for selected worktree or task summary."""
 
+    # Worktree status updates within this window are rendered once, latest wins
+    RENDER_DEBOUNCE: ClassVar[float] = 0.05
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._worktree_name: str = ""
@@ -29,20 +90,59 @@ class StatusPanel(Static):
         self._current_task: Task | None = None
         self._task_statuses: dict[str, GitStatus] = {}
         self._mode: str = "worktree"  # "worktree" or "task"
+        # (signature, Text) of the last worktree render, reused while unchanged
+        self._status_render_cache: tuple[tuple, Text] | None = None
+        self._render_timer: Timer | None = None
+        # Loading requested and not yet superseded by content
+        self._loading = False
 
     def update_status(self, worktree: Worktree | None, status: GitStatus | None) -> None:
         """Update the status display for a worktree."""
+        if (
+            status is not None
+            and status is self._status
+            and worktree is not None
+            and worktree.name == self._worktree_name
+            and self._mode == "worktree"
+            and self._showing_worktree_render()
+        ):
+            # Re-delivery of the status already on screen (e.g. refocusing
+            # the worktree list): nothing to schedule
+            return
         self._mode = "worktree"
+        self._loading = False
         if worktree is None or status is None:
             self._worktree_name = ""
             self._status = None
-            self._update_display()
-            return
+        else:
+            self._worktree_name = worktree.name
+            self._status = status
+        self._schedule_render()
+
+    def _showing_worktree_render(self) -> bool:
+        """True when the last worktree render is on screen with nothing pending."""
+        cached = self._status_render_cache
+        return self._render_timer is None and cached is not None and self.content is cached[1]
+
+    def _schedule_render(self) -> None:
+        """Render the current state once the debounce window closes.
 
-        self._worktree_name = worktree.name
-        self._status = status
+        Fast navigation delivers statuses back to back; only the last state in
+        each window reaches the screen.
+        """
+        if self._render_timer is None:
+            self._render_timer = self.set_timer(self.RENDER_DEBOUNCE, self._flush_render)
+
+    def _flush_render(self) -> None:
+        self._render_timer = None
         self._update_display()
 
+    def _cancel_render(self) -> None:
+        """Drop a pending render superseded by an immediate one."""
+        if self._render_timer is not None:
+            self._render_timer.stop()
+            self._render_timer = None
+
     def update_task_summary(
         self, task: Task | None, statuses: dict[str, GitStatus] | None = None
     ) -> None:
@@ -53,13 +153,17 @@ class StatusPanel(Static):
             statuses: Optional dict of worktree_name -> GitStatus with file details
         """
         self._mode = "task"
+        self._loading = False
         self._current_task = task
         self._task_statuses = statuses or {}
         self._update_display()
 
     def _update_display(self) -> None:
         """Update the display content."""
-        if self._mode == "task":
+        self._cancel_render()
+        if self._loading:
+            self.update(Text("Loading...", style=_DIM_ITALIC))
+        elif self._mode == "task":
             self._render_task_summary()
         else:
             self._render_worktree_status()
@@ -67,7 +171,7 @@ class StatusPanel(Static):
     def _render_task_summary(self) -> None:
         """Render the task summary view — every repo with its changes or 'clean'."""
         if self._current_task is None:
-            self.update(Text("No task selected", style="dim"))
+            self.update(Text("No task selected", style=_DIM))
             return
 
         task = self._current_task
@@ -75,17 +179,17 @@ class StatusPanel(Static):
 
         for wt in task.worktrees:
             # Repo header
-            text.append(f"{wt.name}", style="bold")
+            text.append(f"{wt.name}", style=_BOLD)
             text.append("\n")
 
             if not wt.is_dirty:
-                text.append("clean\n", style="dim")
+                text.append("clean\n", style=_DIM)
             else:
                 status = self._task_statuses.get(wt.name)
                 if status:
                     self._append_changes(text, status)
                 else:
-                    text.append(f"  {wt.changed_files} files changed\n", style="dim italic")
+                    text.append(f"  {wt.changed_files} files changed\n", style=_DIM_ITALIC)
 
             text.append("\n")
 
@@ -94,54 +198,84 @@ class StatusPanel(Static):
     def _render_worktree_status(self) -> None:
         """Render the worktree-specific status view."""
         if not self._worktree_name or self._status is None:
-            self.update(Text("No worktree selected", style="dim"))
+            self.update(Text("No worktree selected", style=_DIM))
             return
 
+        # Periodic refreshes mostly re-deliver an identical status; reuse the
+        # last Text instead of rebuilding it line by line.
+        status = self._status
+        key = (
+            self._worktree_name,
+            status.error,
+            status.branch,
+            status.ahead,
+            status.behind,
+            status.is_dirty,
+            tuple(status.all_changes),
+        )
+        cached = self._status_render_cache
+        if cached is not None and cached[0] == key:
+            if self.content is not cached[1]:
+                self.update(cached[1])
+            return
+
+        text = self._build_worktree_text(status)
+        self._status_render_cache = (key, text)
+        self.update(text)
+
+    def _build_worktree_text(self, status: GitStatus) -> Text:
+        """Build the worktree status view for ``status``."""
+        if not (status.error or status.is_dirty or status.ahead or status.behind):
+            return _clean_worktree_text(self._worktree_name, status.branch)
+
         text = Text()
 
         # Header
-        text.append("Repository: ", style="cyan")
+        text.append("Repository: ", style=_LABEL)
         text.append(f"{self._worktree_name}\n")
 
         # Show error state if present
-        if self._status.error:
-            text.append(f"\nError: {self._status.error}\n", style="red")
-            text.append("Press 'r' to refresh", style="dim")
-            self.update(text)
-            return
+        if status.error:
+            text.append(f"\nError: {status.error}\n", style=_RED)
+            text.append("Press 'r' to refresh", style=_DIM)
+            return text
 
         # Branch
-        text.append("Branch: ", style="cyan")
-        text.append(f"{self._status.branch}\n", style="green")
+        text.append("Branch: ", style=_LABEL)
+        text.append(f"{status.branch}\n", style=_GREEN)
 
         # Sync info — always shown; "up to date" when not ahead/behind
-        text.append("Sync:   ", style="cyan")
-        if self._status.ahead or self._status.behind:
-            if self._status.ahead:
-                text.append(f"↑{self._status.ahead} ", style="green")
-            if self._status.behind:
-                text.append(f"↓{self._status.behind}", style="yellow")
+        text.append("Sync:   ", style=_LABEL)
+        if status.ahead or status.behind:
+            if status.ahead:
+                text.append(f"↑{status.ahead} ", style=_GREEN)
+            if status.behind:
+                text.append(f"↓{status.behind}", style=_YELLOW)
             text.append("\n")
         else:
-            text.append("up to date\n", style="dim")
+            text.append("up to date\n", style=_DIM)
 
         text.append("\n")
 
         # Status
-        if not self._status.is_dirty:
-            text.append("working tree clean", style="dim")
+        if not status.is_dirty:
+            text.append("working tree clean", style=_DIM)
         else:
-            self._append_changes(text, self._status)
+            self._append_changes(text, status)
 
-        self.update(text)
+        return text
 
     @staticmethod
     def _append_changes(text: Text, status: GitStatus) -> None:
         """Append the status entries with per-code styling."""
+        # Collected first and appended in one call: Rich joins the strings once
+        # instead of re-concatenating the text per fragment
+        tokens: list[tuple[str, Style]] = []
         for status_code, filename in status.all_changes:
-            style = _style_for_code(status_code)
-            text.append(f" {status_code} ", style=style)
-            text.append(f"{filename}\n", style="red" if "red" in style else "")
+            code_style, name_style = _style_for_code(status_code)
+            tokens.append((f" {status_code} ", code_style))
+            tokens.append((f"{filename}\n", name_style))
+        text.append_tokens(tokens)
 
     def clear_status(self) -> None:
         """Clear the status display."""
@@ -149,15 +283,22 @@ class StatusPanel(Static):
         self._status = None
         self._current_task = None
         self._mode = "worktree"
-        self.update(Text("No worktree selected", style="dim"))
+        self._loading = False
+        self._cancel_render()
+        self.update(Text("No worktree selected", style=_DIM))
 
     def set_loading(self, loading: bool = True) -> None:
         """Show or hide loading indicator.
 
+        The indicator goes through the render debounce like worktree statuses,
+        so a status that arrives within the window replaces it before it is
+        ever drawn: one update per transition instead of two.
+
         Args:
             loading: If True, show loading indicator. If False, restore display.
         """
+        self._loading = loading
         if loading:
-            self.update(Text("Loading...", style="dim italic"))
+            self._schedule_render()
         else:
             self._update_display()
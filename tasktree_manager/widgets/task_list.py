@@ -1,6 +1,7 @@
 """Task list widget for tasktree-manager."""
 
 from enum import Enum, auto
+from functools import lru_cache
 
 from rich.markup import escape
 from textual.message import Message
@@ -21,12 +22,70 @@ class SortMode(Enum):
     STATUS_CLEAN = auto()
 
 
+# Claude session status -> trailing indicator markup
+_HOOK_INDICATORS = {
+    "running": " [magenta]⟳[/]",
+    "waiting": " [yellow]![/]",
+    "ended": " [green]✓[/]",
+}
+
+# Sort mode -> the one `s` cycles to next, and its footer label
+_SORT_MODES = list(SortMode)
+_NEXT_SORT_MODE = {
+    mode: _SORT_MODES[(i + 1) % len(_SORT_MODES)] for i, mode in enumerate(_SORT_MODES)
+}
+_SORT_LABELS = {
+    SortMode.NAME_ASC: "by name ↑",
+    SortMode.NAME_DESC: "by name ↓",
+    SortMode.DATE_NEWEST: "by date ↓",
+    SortMode.DATE_OLDEST: "by date ↑",
+    SortMode.STATUS_DIRTY: "dirty first",
+    SortMode.STATUS_CLEAN: "clean first",
+}
+
+
+@lru_cache(maxsize=4096)
+def _task_prompt(
+    label: str, dirty_count: int, has_claude_md: bool, claude_status: str | None
+) -> str:
+    """Build the option markup for a task row.
+
+    Cached on the displayed state, so reloads and sort cycles reuse the string
+    for every row whose state did not change.
+    """
+    claude_md = "[blue]◆[/]" if has_claude_md else " "
+    hook_indicator = _HOOK_INDICATORS.get(claude_status, "")
+    # Escape the label: task directories (and aliases) can hold
+    # markup-significant brackets which must not style (or crash)
+    # the list rendering
+    name = escape(label)
+    if dirty_count:
+        return f"[red]●[/]{claude_md}{name} [red]({dirty_count})[/]{hook_indicator}"
+    return f"  {claude_md}{name}{hook_indicator}"
+
+
+def _task_mtime(task: Task) -> float:
+    """Task directory mtime for date sorting; 0 when it is gone.
+
+    Uses the mtime captured when the task was listed. Otherwise stats once
+    (the stat doubling as the existence check) and remembers the result.
+    """
+    if task.mtime is None:
+        try:
+            task.mtime = task.path.stat().st_mtime
+        except OSError:
+            task.mtime = 0
+    return task.mtime
+
+
 class TaskList(OptionList):
     """List of tasks widget."""
 
     class TaskSelected(Message):
         """Message sent when a task is selected."""
 
+        __slots__ = ("task",)
+
         def __init__(self, task: Task | None):
             self.task = task
             super().__init__()
@@ -34,6 +93,8 @@ class TaskList(OptionList):
     class TaskHighlighted(Message):
         """Message sent when a task is highlighted."""
 
+        __slots__ = ("task",)
+
         def __init__(self, task: Task | None):
             self.task = task
             super().__init__()
@@ -41,6 +102,8 @@ class TaskList(OptionList):
     class SortModeChanged(Message):
         """Message sent when the sort mode changes."""
 
+        __slots__ = ("mode", "label")
+
         def __init__(self, mode: SortMode, label: str):
             self.mode = mode
             self.label = label
@@ -57,6 +120,15 @@ class TaskList(OptionList):
         self._sort_mode: SortMode = SortMode.NAME_ASC
         # Last known Claude session statuses, kept so indicators survive reloads
         self._claude_statuses: dict[str, str] = {}
+        # Signature of the last load_tasks input, so refresh_tasks can skip
+        # re-sorting and re-rendering an unchanged list
+        self._loaded_signature: tuple | None = None
+        # task name -> row_state() of the loaded tasks, so re-rendering a row
+        # (e.g. a Claude indicator change) does not go back to disk
+        self._row_states: dict[str, tuple[str, bool]] = {}
+        # task name -> the Option currently in the list, reused by full
+        # rebuilds for every row whose prompt is unchanged
+        self._option_cache: dict[str, Option] = {}
         # Footer-visible (key, app action, description) bindings shown while
         # this panel has focus; the keys also exist app-level (hidden) so
         # they keep working regardless of focus
@@ -77,32 +149,41 @@ class TaskList(OptionList):
         """Compatibility property - sets highlighted index."""
         self.highlighted = value
 
+    @staticmethod
+    def row_state(task: Task) -> tuple[str, bool]:
+        """Disk-backed part of a task row: (display label, has CLAUDE.md).
+
+        Both are filesystem reads, so workers compute these off the UI thread
+        and hand them to load_tasks.
+        """
+        return task.display_label, task.has_claude_md
+
+    def _row_state_for(self, task: Task) -> tuple[str, bool]:
+        """row_state() of a loaded task, read from disk at most once per load."""
+        state = self._row_states.get(task.name)
+        if state is None:
+            state = self._row_states[task.name] = self.row_state(task)
+        return state
+
+    def _label_key(self, task: Task) -> str:
+        """Case-insensitive name-sort key: the displayed label."""
+        return self._row_state_for(task)[0].lower()
+
     def _format_task_option(self, task: Task, claude_status: str | None = None) -> Option:
         """Format a task as an Option for display."""
-        claude_md = "[blue]◆[/]" if task.has_claude_md else " "
-        if claude_status == "running":
-            hook_indicator = " [magenta]⟳[/]"
-        elif claude_status == "waiting":
-            hook_indicator = " [yellow]![/]"
-        elif claude_status == "ended":
-            hook_indicator = " [green]✓[/]"
-        else:
-            hook_indicator = ""
-        # Escape the label: task directories (and aliases) can hold
-        # markup-significant brackets which must not style (or crash)
-        # the list rendering
-        name = escape(task.display_label)
-        if task.is_dirty:
-            prompt = f"[red]●[/]{claude_md}{name} [red]({task.dirty_count})[/]{hook_indicator}"
-        else:
-            prompt = f"  {claude_md}{name}{hook_indicator}"
-        return Option(prompt, id=task.name)
+        label, has_claude_md = self._row_state_for(task)
+        prompt = _task_prompt(label, task.dirty_count, has_claude_md, claude_status)
+        option = self._option_cache.get(task.name)
+        if option is None or option.prompt != prompt:
+            option = Option(prompt, id=task.name)
+        return option
 
     def load_tasks(
         self,
         tasks: list[Task],
         preserve_selection: str | None = None,
         claude_statuses: dict[str, str] | None = None,
+        row_states: dict[str, tuple[str, bool]] | None = None,
     ) -> None:
         """Load tasks into the list.
 
@@ -110,15 +191,46 @@ class TaskList(OptionList):
             tasks: List of tasks to load
             preserve_selection: Optional task name to preserve selection for
             claude_statuses: Optional dict of task_name -> claude status string
+            row_states: Optional dict of task_name -> row_state(), precomputed
+                off the UI thread; missing tasks are read here
         """
-        sorted_tasks = self._sort_tasks(tasks)
-        self.tasks = sorted_tasks
-        self.clear_options()
+        self._row_states = dict(row_states) if row_states else {}
+        self._loaded_signature = self._tasks_signature(tasks)
         if claude_statuses is not None:
             self._claude_statuses = claude_statuses
-        for task in sorted_tasks:
-            self.add_option(self._format_task_option(task, self._claude_statuses.get(task.name)))
+        self._render(self._sort_tasks(tasks))
+        self._select(preserve_selection)
+
+    def _render(self, sorted_tasks: list[Task]) -> None:
+        """Show ``sorted_tasks``, touching only what changed on screen."""
+        options = [
+            self._format_task_option(task, self._claude_statuses.get(task.name))
+            for task in sorted_tasks
+        ]
+        if self.option_count == len(options) and [t.name for t in self.tasks] == [
+            t.name for t in sorted_tasks
+        ]:
+            # Same tasks in the same order (the usual periodic refresh): only
+            # re-render the rows whose dirty/Claude state actually changed
+            for i, option in enumerate(options):
+                if self.get_option_at_index(i).prompt != option.prompt:
+                    self.replace_option_prompt_at_index(i, option.prompt)
+        else:
+            self.clear_options()
+            self.add_options(options)
+        self.tasks = sorted_tasks
+        # Patched rows keep their Option (prompt replaced in place), so the
+        # list is the cache; rebuilding it also drops tasks that went away
+        self._option_cache = {option.id: option for option in self.options}
+
+    def _select(
+        self, preserve_selection: str | None = None, fallback_index: int | None = None
+    ) -> None:
+        """Highlight ``preserve_selection`` if listed, else the first task.
 
+        ``fallback_index`` (when in range) replaces the first task as the
+        fallback for a preserved task that is no longer listed.
+        """
         # Select item - preserve previous selection if specified
         if self.tasks and self.option_count > 0:
             if preserve_selection:
@@ -135,7 +247,10 @@ class TaskList(OptionList):
                     self.call_later(set_highlight)
                     return  # Don't emit here, will be done in callback
                 except OptionDoesNotExist:
-                    self.action_first()
+                    if fallback_index is not None and fallback_index < self.option_count:
+                        self.highlighted = fallback_index
+                    else:
+                        self.action_first()
             else:
                 self.action_first()
             self._emit_highlighted()
@@ -162,11 +277,42 @@ class TaskList(OptionList):
 
     def refresh_tasks(self, tasks: list[Task]) -> None:
         """Refresh the task list while preserving selection."""
-        current_index = self.highlighted
-        self.load_tasks(tasks)
-        if current_index is not None and current_index < len(tasks):
-            self.highlighted = current_index
-            self._emit_highlighted()
+        # Re-read every row from disk: an alias or CLAUDE.md may have changed
+        self._row_states = {}
+        signature = self._tasks_signature(tasks)
+        if signature == self._loaded_signature:
+            # Every row shows the same thing in the same order: keep the rows,
+            # only swap in the fresh Task objects
+            by_name = {task.name: task for task in tasks}
+            self.tasks = [by_name[task.name] for task in self.tasks]
+            return
+        # One load that restores the selection itself: the same task if it is
+        # still listed, else whatever now sits at its old position
+        current, current_index = self.get_selected_task(), self.highlighted
+        self._loaded_signature = signature
+        self._render(self._sort_tasks(tasks))
+        self._select(current.name if current else None, fallback_index=current_index)
+
+    def _tasks_signature(self, tasks: list[Task]) -> tuple:
+        """What the list shows for ``tasks`` and how it orders them.
+
+        Sort mode plus each task's name, dirty count and row_state(), and its
+        mtime when sorting by date. Row states are read (and kept) through
+        _row_state_for, so the render that follows a mismatch reuses them.
+        """
+        by_date = self._sort_mode in (SortMode.DATE_NEWEST, SortMode.DATE_OLDEST)
+        return (
+            self._sort_mode,
+            tuple(
+                (
+                    task.name,
+                    task.dirty_count,
+                    self._row_state_for(task),
+                    _task_mtime(task) if by_date else None,
+                )
+                for task in tasks
+            ),
+        )
 
     def refresh_claude_indicators(self, statuses: dict[str, str]) -> None:
         """Update Claude status indicators without full reload.
@@ -176,65 +322,41 @@ class TaskList(OptionList):
         self._claude_statuses = statuses
         for i, task in enumerate(self.tasks):
             new_option = self._format_task_option(task, statuses.get(task.name))
-            self.replace_option_prompt_at_index(i, new_option.prompt)
+            if new_option is not self.get_option_at_index(i):
+                self.replace_option_prompt_at_index(i, new_option.prompt)
 
     def cycle_sort_mode(self) -> None:
         """Cycle through sort modes and reload tasks."""
-        modes = list(SortMode)
-        current_idx = modes.index(self._sort_mode)
-        self._sort_mode = modes[(current_idx + 1) % len(modes)]
+        self._sort_mode = _NEXT_SORT_MODE[self._sort_mode]
 
-        # Re-sort and reload with current tasks
+        # Re-sort the current tasks (their rows are reused from the option
+        # cache) and keep the highlighted task selected
         if self.tasks:
-            sorted_tasks = self._sort_tasks(self.tasks)
-            self.tasks = sorted_tasks
-            self.clear_options()
-            for task in sorted_tasks:
-                self.add_option(
-                    self._format_task_option(task, self._claude_statuses.get(task.name))
-                )
-
-            if self.tasks and self.option_count > 0:
-                self.action_first()
-                self._emit_highlighted()
+            current = self.get_selected_task()
+            self._loaded_signature = self._tasks_signature(self.tasks)
+            self._render(self._sort_tasks(self.tasks))
+            self._select(current.name if current else None)
 
         self.post_message(self.SortModeChanged(self._sort_mode, self.get_sort_label()))
 
     def get_sort_label(self) -> str:
         """Get display label for current sort mode."""
-        match self._sort_mode:
-            case SortMode.NAME_ASC:
-                return "by name ↑"
-            case SortMode.NAME_DESC:
-                return "by name ↓"
-            case SortMode.DATE_NEWEST:
-                return "by date ↓"
-            case SortMode.DATE_OLDEST:
-                return "by date ↑"
-            case SortMode.STATUS_DIRTY:
-                return "dirty first"
-            case SortMode.STATUS_CLEAN:
-                return "clean first"
+        return _SORT_LABELS[self._sort_mode]
 
     def _sort_tasks(self, tasks: list[Task]) -> list[Task]:
         """Sort tasks according to current sort mode."""
         match self._sort_mode:
+            # The label comes from the row state, so name sorts no longer
+            # re-read each task's alias file that the row render reads anyway
             case SortMode.NAME_ASC:
-                return sorted(tasks, key=lambda t: t.display_label.lower())
+                return sorted(tasks, key=self._label_key)
             case SortMode.NAME_DESC:
-                return sorted(tasks, key=lambda t: t.display_label.lower(), reverse=True)
+                return sorted(tasks, key=self._label_key, reverse=True)
             case SortMode.DATE_NEWEST:
-                return sorted(
-                    tasks,
-                    key=lambda t: t.path.stat().st_mtime if t.path.exists() else 0,
-                    reverse=True,
-                )
+                return sorted(tasks, key=_task_mtime, reverse=True)
             case SortMode.DATE_OLDEST:
-                return sorted(
-                    tasks,
-                    key=lambda t: t.path.stat().st_mtime if t.path.exists() else 0,
-                )
+                return sorted(tasks, key=_task_mtime)
             case SortMode.STATUS_DIRTY:
-                return sorted(tasks, key=lambda t: (not t.is_dirty, t.name.lower()))
+                return sorted(tasks, key=lambda t: (not t.is_dirty, t.name_lower))
             case SortMode.STATUS_CLEAN:
-                return sorted(tasks, key=lambda t: (t.is_dirty, t.name.lower()))
+                return sorted(tasks, key=lambda t: (t.is_dirty, t.name_lower))
@@ -1,5 +1,6 @@
 """Worktree list widget for tasktree-manager."""
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from rich.markup import escape
@@ -32,12 +33,28 @@ CI_BADGES = {
 }
 
 
+@lru_cache(maxsize=1024)
+def _row_columns(name: str, branch: str, name_width: int, branch_width: int) -> str:
+    """The aligned name and branch columns of a worktree row.
+
+    Cached on the column widths, so badge refreshes, grouping toggles and
+    reloads of the same worktrees reuse the padded, escaped markup.
+    """
+    # Pad first, then escape: git allows markup-significant brackets in
+    # branch names, and escaping adds characters that would skew padding
+    name_col = escape(f"{name:<{name_width}}")
+    branch_col = escape(f"{branch:<{branch_width}}")
+    return f"{name_col}  [dim]{branch_col}[/]"
+
+
 class WorktreeList(OptionList):
     """List of worktrees widget."""
 
     class WorktreeSelected(Message):
         """Message sent when a worktree is selected."""
 
+        __slots__ = ("worktree",)
+
         def __init__(self, worktree: Worktree | None):
             self.worktree = worktree
             super().__init__()
@@ -45,6 +62,8 @@ class WorktreeList(OptionList):
     class WorktreeHighlighted(Message):
         """Message sent when a worktree is highlighted."""
 
+        __slots__ = ("worktree",)
+
         def __init__(self, worktree: Worktree | None):
             self.worktree = worktree
             super().__init__()
@@ -52,6 +71,8 @@ class WorktreeList(OptionList):
     class GroupingChanged(Message):
         """Message sent when the grouping mode changes."""
 
+        __slots__ = ("enabled",)
+
         def __init__(self, enabled: bool):
             self.enabled = enabled
             super().__init__()
@@ -65,8 +86,8 @@ class WorktreeList(OptionList):
         super().__init__(*args, **kwargs)
         self.worktrees: list[Worktree] = []
         self._grouping_enabled: bool = False
-        # Maps option index to worktree index (for handling headers)
-        self._option_to_worktree: dict[int, int] = {}
+        # Worktree index per option index; -1 marks group headers
+        self._option_to_worktree: list[int] = []
         # Badge state keyed by str(worktree.path) — survives load_worktrees
         # reloads (same pattern as TaskList._claude_statuses)
         self._session_states: dict[str, str] = {}
@@ -102,20 +123,28 @@ class WorktreeList(OptionList):
             preserve_selection: Optional worktree name to preserve selection for
         """
         self.worktrees = worktrees
+        if worktrees:
+            # Calculate column widths for alignment
+            self._max_name_len = max(len(wt.name) for wt in worktrees)
+            self._max_branch_len = max(len(wt.branch or "unknown") for wt in worktrees)
+        self._populate(preserve_selection)
+
+    def _populate(self, preserve_selection: str | None = None) -> None:
+        """Rebuild the rows for the loaded worktrees and column widths."""
+        worktrees = self.worktrees
         self._option_to_worktree.clear()
         self.clear_options()
 
         if not worktrees:
             return
 
-        # Calculate column widths for alignment
-        self._max_name_len = max(len(wt.name) for wt in worktrees)
-        self._max_branch_len = max(len(wt.branch or "unknown") for wt in worktrees)
-
+        # Rows are collected first and added in one call: a single
+        # line-cache reset and refresh instead of one per row
         if self._grouping_enabled:
-            self._load_grouped_worktrees(worktrees)
+            options = self._grouped_options(worktrees)
         else:
-            self._load_flat_worktrees(worktrees)
+            options = self._flat_options(worktrees)
+        self.add_options(options)
 
         # Select item - preserve previous selection if specified
         if self.worktrees and self.option_count > 0:
@@ -138,46 +167,54 @@ class WorktreeList(OptionList):
                 self.action_first()
             self._emit_highlighted()
 
-    def _load_flat_worktrees(self, worktrees: list[Worktree]) -> None:
-        """Load worktrees without grouping."""
+    def _flat_options(self, worktrees: list[Worktree]) -> list[Option]:
+        """Build the rows for worktrees without grouping."""
+        options = []
         for idx, worktree in enumerate(worktrees):
-            option_idx = self.option_count
-            self._option_to_worktree[option_idx] = idx
-            self._add_worktree_option(worktree)
-
-    def _load_grouped_worktrees(self, worktrees: list[Worktree]) -> None:
-        """Load worktrees grouped by dirty/clean status."""
-        dirty = [(i, wt) for i, wt in enumerate(worktrees) if wt.is_dirty]
-        clean = [(i, wt) for i, wt in enumerate(worktrees) if not wt.is_dirty]
+            self._option_to_worktree.append(idx)
+            options.append(self._worktree_option(worktree))
+        return options
+
+    def _grouped_options(self, worktrees: list[Worktree]) -> list[Option | None]:
+        """Build the rows for worktrees grouped by dirty/clean status."""
+        # Partitioned in one pass, keeping each worktree's original index
+        dirty: list[tuple[int, Worktree]] = []
+        clean: list[tuple[int, Worktree]] = []
+        for i, wt in enumerate(worktrees):
+            (dirty if wt.is_dirty else clean).append((i, wt))
+        options: list[Option | None] = []
+        # Separators take no option index, so only headers and rows are mapped
+        mapping = self._option_to_worktree
 
         # Add dirty section
         if dirty:
-            self.add_option(Option("[bold red]Dirty[/]", disabled=True))
+            options.append(Option("[bold red]Dirty[/]", disabled=True))
+            mapping.append(-1)
             for orig_idx, worktree in dirty:
-                option_idx = self.option_count
-                self._option_to_worktree[option_idx] = orig_idx
-                self._add_worktree_option(worktree)
+                mapping.append(orig_idx)
+                options.append(self._worktree_option(worktree))
 
         # Add separator between groups if both exist
         if dirty and clean:
-            self.add_option(None)  # None creates a separator
+            options.append(None)  # None creates a separator
 
         # Add clean section
         if clean:
-            self.add_option(Option("[bold green]Clean[/]", disabled=True))
+            options.append(Option("[bold green]Clean[/]", disabled=True))
+            mapping.append(-1)
             for orig_idx, worktree in clean:
-                option_idx = self.option_count
-                self._option_to_worktree[option_idx] = orig_idx
-                self._add_worktree_option(worktree)
+                mapping.append(orig_idx)
+                options.append(self._worktree_option(worktree))
+        return options
 
     def _build_prompt(self, worktree: Worktree) -> str:
         """Compose one worktree row with badge cells and aligned columns."""
-        branch = worktree.branch or "unknown"
-        # Pad first, then escape: git allows markup-significant brackets in
-        # branch names, and escaping adds characters that would skew padding
-        name_col = escape(f"{worktree.name:<{self._max_name_len}}")
-        branch_padded = escape(f"{branch:<{self._max_branch_len}}")
-        branch_col = f"[dim]{branch_padded}[/]"
+        columns = _row_columns(
+            worktree.name,
+            worktree.branch or "unknown",
+            self._max_name_len,
+            self._max_branch_len,
+        )
         claude_indicator = "[blue]◆[/]" if worktree.has_claude_md else " "
 
         path_key = str(worktree.path)
@@ -190,11 +227,11 @@ class WorktreeList(OptionList):
             git_status = f"[red]✗ {worktree.changed_files} files[/]"
         else:
             git_status = "[green]✓[/]"
-        return f" {session}{claude_indicator}{name_col}  {branch_col}  {mr}{ci}  {git_status}"
+        return f" {session}{claude_indicator}{columns}  {mr}{ci}  {git_status}"
 
-    def _add_worktree_option(self, worktree: Worktree) -> None:
-        """Add a single worktree option to the list."""
-        self.add_option(Option(self._build_prompt(worktree), id=worktree.name))
+    def _worktree_option(self, worktree: Worktree) -> Option:
+        """Build the option for a single worktree."""
+        return Option(self._build_prompt(worktree), id=worktree.name)
 
     def refresh_status_badges(
         self,
@@ -227,9 +264,11 @@ class WorktreeList(OptionList):
 
         # Use mapping if grouping is enabled
         if self._grouping_enabled:
-            worktree_idx = self._option_to_worktree.get(self.highlighted)
-            if worktree_idx is not None and 0 <= worktree_idx < len(self.worktrees):
-                return self.worktrees[worktree_idx]
+            mapping = self._option_to_worktree
+            if 0 <= self.highlighted < len(mapping):
+                worktree_idx = mapping[self.highlighted]
+                if 0 <= worktree_idx < len(self.worktrees):
+                    return self.worktrees[worktree_idx]
             return None
 
         # Flat mode - direct index mapping
@@ -256,8 +295,8 @@ class WorktreeList(OptionList):
         """Toggle grouping mode and reload worktrees."""
         self._grouping_enabled = not self._grouping_enabled
 
-        # Reload with current worktrees
+        # Same worktrees, new layout: the column widths still apply
         if self.worktrees:
-            self.load_worktrees(list(self.worktrees))
+            self._populate()
 
         self.post_message(self.GroupingChanged(self._grouping_enabled))
@@ -1,5 +1,7 @@
 """Pytest fixtures for tasktree-manager tests."""
 
+import shlex
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -24,47 +26,57 @@ def _reset_forge():
     forge.clear_cache()
 
 
-def get_default_branch(repo_path: Path) -> str:
-    """Get the default branch name of a git repo."""
-    result = subprocess.run(
-        ["git", "branch", "--show-current"],
-        cwd=repo_path,
-        capture_output=True,
-        text=True,
+# Branch every test repo is created on (git init -b), so fixtures know it
+# without asking git
+DEFAULT_BRANCH = "main"
+
+
+# Identity for commits in test repos
+_GIT_IDENTITY = 'git config user.email test@test.com && git config user.name "Test User"'
+
+
+def run_git_script(script: str, cwd: Path) -> None:
+    """Run a chain of git commands in one shell instead of one process each.
+
+    Output is discarded; stderr is kept so a failing setup still reports
+    git's error on the raised CalledProcessError.
+    """
+    subprocess.run(
+        ["sh", "-c", script], cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True
     )
-    return result.stdout.strip() or "main"
 
 
 def create_git_repo(repo_path: Path) -> str:
     """Create a git repository and return the default branch name."""
     repo_path.mkdir(exist_ok=True)
 
-    subprocess.run(["git", "init"], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
-    )
-
-    # Create initial commit
+    # Initial commit
     readme = repo_path / "README.md"
     readme.write_text(f"# {repo_path.name}\n")
-    subprocess.run(["git", "add", "."], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
+    run_git_script(
+        f"git init -q -b {DEFAULT_BRANCH} && {_GIT_IDENTITY}"
+        ' && git add . && git commit -q -m "Initial commit"',
+        repo_path,
     )
 
-    return get_default_branch(repo_path)
+    return DEFAULT_BRANCH
+
+
+@pytest.fixture(scope="session")
+def _template_repo(tmp_path_factory):
+    """One committed repo per session, copied by the repo fixtures.
+
+    Copying the few files of a fresh repo is much cheaper than re-running
+    the git setup for every repo of every test. Returns (path, branch).
+    """
+    repo_path = tmp_path_factory.mktemp("template") / "repo"
+    return repo_path, create_git_repo(repo_path)
+
+
+def copy_git_repo(template: tuple[Path, str], repo_path: Path) -> str:
+    """Copy the template repo to ``repo_path`` and return its branch name."""
+    shutil.copytree(template[0], repo_path, symlinks=True)
+    return template[1]
 
 
 @pytest.fixture
@@ -95,28 +107,27 @@ def task_manager(config):
 
 
 @pytest.fixture
-def sample_repo(temp_dirs):
+def sample_repo(temp_dirs, _template_repo):
     """Create a sample git repository."""
     repos_dir, _ = temp_dirs
     repo_path = repos_dir / "sample-repo"
-    branch = create_git_repo(repo_path)
+    branch = copy_git_repo(_template_repo, repo_path)
     return repo_path, branch
 
 
 @pytest.fixture
-def sample_repos(temp_dirs):
+def sample_repos(temp_dirs, _template_repo):
     """Create multiple sample git repositories."""
     repos_dir, _ = temp_dirs
     repo_names = ["repo-alpha", "repo-beta", "repo-gamma"]
     repos = []
-    branch = None
 
     for name in repo_names:
         repo_path = repos_dir / name
-        branch = create_git_repo(repo_path)
+        copy_git_repo(_template_repo, repo_path)
         repos.append(repo_path)
 
-    return repos, branch
+    return repos, _template_repo[1]
 
 
 @pytest.fixture
@@ -143,50 +154,17 @@ def repo_with_remote(tmp_path):
     # Create bare "remote" repository
     remote = tmp_path / "remote.git"
     remote.mkdir()
-    subprocess.run(["git", "init", "--bare"], cwd=remote, capture_output=True, check=True)
 
-    # Create local repository with initial commit
+    # Create local repository with initial commit, pushed to the remote
     local = tmp_path / "local"
     local.mkdir()
-    subprocess.run(["git", "init"], cwd=local, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=local,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=local,
-        capture_output=True,
-        check=True,
-    )
-
-    # Add remote
-    subprocess.run(
-        ["git", "remote", "add", "origin", str(remote)],
-        cwd=local,
-        capture_output=True,
-        check=True,
-    )
-
-    # Create initial commit
     readme = local / "README.md"
     readme.write_text("# Test Repo\n")
-    subprocess.run(["git", "add", "."], cwd=local, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=local,
-        capture_output=True,
-        check=True,
-    )
-
-    # Push to remote
-    subprocess.run(
-        ["git", "push", "-u", "origin", "HEAD"],
-        cwd=local,
-        capture_output=True,
-        check=True,
+    run_git_script(
+        f"git init -q --bare {shlex.quote(str(remote))} && git init -q && {_GIT_IDENTITY}"
+        f" && git remote add origin {shlex.quote(str(remote))}"
+        ' && git add . && git commit -q -m "Initial commit" && git push -q -u origin HEAD',
+        local,
     )
 
     return local, remote
@@ -202,30 +180,17 @@ def repo_with_origin(config, tmp_path):
     """
     remote = tmp_path / "origin" / "repo-remote.git"
     remote.mkdir(parents=True)
-    subprocess.run(["git", "init", "--bare"], cwd=remote, capture_output=True, check=True)
 
     repo = config.repos_dir / "repo-remote"
     repo.mkdir()
-    subprocess.run(["git", "init"], cwd=repo, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"], cwd=repo, capture_output=True, check=True
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"], cwd=repo, capture_output=True, check=True
-    )
-    subprocess.run(
-        ["git", "remote", "add", "origin", str(remote)], cwd=repo, capture_output=True, check=True
-    )
     (repo / "README.md").write_text("# repo-remote\n")
-    subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-    subprocess.run(["git", "commit", "-m", "Initial"], cwd=repo, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "push", "-u", "origin", "HEAD"], cwd=repo, capture_output=True, check=True
+    run_git_script(
+        f"git init -q --bare {shlex.quote(str(remote))} && git init -q -b {DEFAULT_BRANCH}"
+        f" && {_GIT_IDENTITY} && git remote add origin {shlex.quote(str(remote))}"
+        " && git add . && git commit -q -m Initial && git push -q -u origin HEAD",
+        repo,
     )
-    branch = subprocess.run(
-        ["git", "branch", "--show-current"], cwd=repo, capture_output=True, text=True
-    ).stdout.strip()
-    return branch
+    return DEFAULT_BRANCH
 
 
 @pytest.fixture
@@ -241,57 +206,35 @@ def squash_merged_task(config, task_manager, repo_with_origin):
     wt = task.worktrees[0]
 
     (wt.path / "feature.txt").write_text("feature\n")
-    subprocess.run(["git", "add", "."], cwd=wt.path, capture_output=True, check=True)
-    subprocess.run(["git", "commit", "-m", "feat"], cwd=wt.path, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "push", "-u", "origin", "HEAD"], cwd=wt.path, capture_output=True, check=True
-    )
+    run_git_script("git add . && git commit -q -m feat && git push -q -u origin HEAD", wt.path)
 
     # Simulate the squash merge from a scratch clone: same content lands on
     # base as a brand-new commit that is no descendant of the branch commit
-    remote_url = subprocess.run(
-        ["git", "remote", "get-url", "origin"], cwd=wt.path, capture_output=True, text=True
-    ).stdout.strip()
     scratch = config.repos_dir.parent / "squash-scratch"
-    subprocess.run(
-        ["git", "clone", "--branch", base, remote_url, str(scratch)],
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=scratch,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"], cwd=scratch, capture_output=True, check=True
+    run_git_script(
+        f'git clone -q --branch {base} "$(git remote get-url origin)" {shlex.quote(str(scratch))}',
+        wt.path,
     )
     (scratch / "feature.txt").write_text("feature\n")
-    subprocess.run(["git", "add", "."], cwd=scratch, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "commit", "-m", "feat (squash !42)"], cwd=scratch, capture_output=True, check=True
+    run_git_script(
+        f"{_GIT_IDENTITY} && git add . && git commit -q -m 'feat (squash !42)'"
+        f" && git push -q origin {base}",
+        scratch,
     )
-    subprocess.run(["git", "push", "origin", base], cwd=scratch, capture_output=True, check=True)
 
     return task, base
 
 
 @pytest.fixture
-def repo_with_forge_url(config):
+def repo_with_forge_url(config, _template_repo):
     """A repo in REPOS_DIR with a fake GitLab https origin (never fetched).
 
     Provider detection is purely URL-based, so no network is touched as long
     as nothing runs a real glab against it.
     """
     repo_path = config.repos_dir / "forge-repo"
-    branch = create_git_repo(repo_path)
-    subprocess.run(
-        ["git", "remote", "add", "origin", "https://gitlab.example.com/group/project.git"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
-    )
+    branch = copy_git_repo(_template_repo, repo_path)
+    run_git_script("git remote add origin https://gitlab.example.com/group/project.git", repo_path)
     return repo_path, branch
 
 
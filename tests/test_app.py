@@ -1,7 +1,15 @@
 """Tests for the main tasktree-manager application."""
 
+import os
 import shutil
 
+import pytest
+import pytest_asyncio
+
+from tasktree_manager.app import TaskTreeApp
+from tasktree_manager.services.config import Config
+from tasktree_manager.services.models import Task, Worktree
+from tasktree_manager.services.task_manager import TaskManager
 from tasktree_manager.widgets.create_modal import (
     AddRepoModal,
     ConfirmModal,
@@ -9,39 +17,59 @@ from tasktree_manager.widgets.create_modal import (
     SafeDeleteModal,
 )
 from tasktree_manager.widgets.status_panel import StatusPanel
-from tasktree_manager.widgets.task_list import TaskList
+from tasktree_manager.widgets.task_list import SortMode, TaskList
 from tasktree_manager.widgets.worktree_list import WorktreeList
 
+# Read-only tests share one running app (and its event loop) per module
+shared_app = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def running_app(tmp_path_factory):
+    """A started app with empty repos/tasks dirs, for tests that only look."""
+    root = tmp_path_factory.mktemp("running-app")
+    (root / "repos").mkdir()
+    config = Config(
+        repos_dir=root / "repos",
+        tasks_dir=root / "wtasks",
+        config_dir=root / ".config" / "tasktree-manager",
+    )
+    config.ensure_dirs()
+    config.agent_poll_interval = 0
+    config.forge_poll_interval = 0
+    app = TaskTreeApp()
+    app.config = config
+    app.task_manager = TaskManager(config)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        yield app
+
 
 class TestTaskTreeApp:
     """Tests for TaskTreeApp class."""
 
-    async def test_app_starts(self, app):
+    @shared_app
+    async def test_app_starts(self, running_app):
         """Test that the app starts without errors."""
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            assert app.is_running
+        assert running_app.is_running
 
-    async def test_app_has_task_list(self, app):
+    @shared_app
+    async def test_app_has_task_list(self, running_app):
         """Test that app has a task list widget."""
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            task_list = app.query_one("#task-list", TaskList)
-            assert task_list is not None
+        task_list = running_app.query_one("#task-list", TaskList)
+        assert task_list is not None
 
-    async def test_app_has_worktree_list(self, app):
+    @shared_app
+    async def test_app_has_worktree_list(self, running_app):
         """Test that app has a worktree list widget."""
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            worktree_list = app.query_one("#worktree-list", WorktreeList)
-            assert worktree_list is not None
+        worktree_list = running_app.query_one("#worktree-list", WorktreeList)
+        assert worktree_list is not None
 
-    async def test_app_has_status_panel(self, app):
+    @shared_app
+    async def test_app_has_status_panel(self, running_app):
         """Test that app has a status panel widget."""
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            status_panel = app.query_one("#status-display", StatusPanel)
-            assert status_panel is not None
+        status_panel = running_app.query_one("#status-display", StatusPanel)
+        assert status_panel is not None
 
     async def test_quit_action(self, app):
         """Test that q quits the app."""
@@ -151,6 +179,209 @@ class TestTaskListWidget:
             assert len(task_list.tasks) == 1
             assert task_list.tasks[0].name == "LOADED-TASK"
 
+    async def test_reload_same_tasks_patches_changed_rows(self, app, tmp_path):
+        """Reloading the same task order only re-renders rows that changed."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            task_list = app.query_one("#task-list", TaskList)
+
+            clean = Worktree(name="repo", path=tmp_path / "a" / "repo")
+            tasks = [
+                Task(name="A", path=tmp_path / "a", worktrees=[clean]),
+                Task(name="B", path=tmp_path / "b", worktrees=[Worktree("repo", tmp_path)]),
+            ]
+            task_list.load_tasks(tasks)
+            await pilot.pause()
+            options = [task_list.get_option_at_index(i) for i in range(2)]
+
+            tasks[1].worktrees[0].is_dirty = True
+            task_list.load_tasks(tasks)
+            await pilot.pause()
+
+            # Same Option objects (no rebuild); only B's prompt changed
+            assert task_list.get_option_at_index(0) is options[0]
+            assert task_list.get_option_at_index(1) is options[1]
+            assert "(1)" in str(task_list.get_option_at_index(1).prompt)
+
+            task_list.load_tasks(tasks[:1])
+            await pilot.pause()
+            assert task_list.option_count == 1
+            assert task_list.tasks == tasks[:1]
+
+    async def test_rebuild_reuses_options_of_unchanged_rows(self, app, tmp_path):
+        """A full rebuild (new task added) keeps the Options of unchanged rows."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            task_list = app.query_one("#task-list", TaskList)
+
+            tasks = [Task(name=n, path=tmp_path / n) for n in ("alpha", "gamma")]
+            task_list.load_tasks(tasks)
+            await pilot.pause()
+            options = {option.id: option for option in task_list.options}
+
+            tasks.append(Task(name="beta", path=tmp_path / "beta"))
+            task_list.load_tasks(tasks)
+            await pilot.pause()
+
+            assert [o.id for o in task_list.options] == ["alpha", "beta", "gamma"]
+            assert task_list.get_option("alpha") is options["alpha"]
+            assert task_list.get_option("gamma") is options["gamma"]
+
+            task_list.load_tasks(tasks[1:])
+            await pilot.pause()
+            assert set(task_list._option_cache) == {"beta", "gamma"}
+
+    async def test_cycle_sort_reorders_existing_options(self, app, tmp_path):
+        """Cycling the sort mode reorders the same Option objects, keeping selection."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            task_list = app.query_one("#task-list", TaskList)
+
+            tasks = [Task(name=n, path=tmp_path / n) for n in ("alpha", "beta", "gamma")]
+            task_list.load_tasks(tasks)
+            await pilot.pause()
+            options = {option.id: option for option in task_list.options}
+
+            task_list.cycle_sort_mode()  # NAME_ASC -> NAME_DESC
+            await pilot.pause()
+
+            assert [o.id for o in task_list.options] == ["gamma", "beta", "alpha"]
+            assert all(options[o.id] is o for o in task_list.options)
+            # The highlighted task stays selected at its new position
+            assert task_list.get_selected_task().name == "alpha"
+            assert task_list.highlighted == 2
+
+    async def test_refresh_unchanged_tasks_skips_reload(self, app, tmp_path):
+        """Refreshing with unchanged tasks keeps the rows but adopts new objects."""
+        for name in ("beta", "alpha"):
+            (tmp_path / name).mkdir()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            task_list = app.query_one("#task-list", TaskList)
+
+            tasks = [Task(name=n, path=tmp_path / n) for n in ("beta", "alpha")]
+            task_list.load_tasks(tasks)
+            await pilot.pause()
+            options = list(task_list.options)
+
+            fresh = [Task(name=n, path=tmp_path / n) for n in ("beta", "alpha")]
+            task_list.refresh_tasks(fresh)
+
+            assert list(task_list.options) == options
+            assert all(a is b for a, b in zip(task_list.options, options, strict=True))
+            assert [t.name for t in task_list.tasks] == ["alpha", "beta"]
+            assert task_list.tasks[0] is fresh[1]
+
+            fresh[0].worktrees.append(Worktree("repo", tmp_path, is_dirty=True))
+            task_list.refresh_tasks(fresh)
+            assert "[red]●[/]" in str(task_list.get_option("beta").prompt)
+
+    async def test_refresh_rerenders_changed_label_and_claude_md(self, app, tmp_path):
+        """A new alias or CLAUDE.md alone (same names and dirty counts) re-renders."""
+        for name in ("alpha", "beta"):
+            (tmp_path / name).mkdir()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            task_list = app.query_one("#task-list", TaskList)
+
+            task_list.load_tasks([Task(name=n, path=tmp_path / n) for n in ("alpha", "beta")])
+            await pilot.pause()
+
+            (tmp_path / "alpha" / ".tasktree_name").write_text("Renamed\n")
+            task_list.refresh_tasks([Task(name=n, path=tmp_path / n) for n in ("alpha", "beta")])
+            assert "Renamed" in str(task_list.get_option("alpha").prompt)
+
+            (tmp_path / "beta" / "CLAUDE.md").write_text("# beta\n")
+            task_list.refresh_tasks([Task(name=n, path=tmp_path / n) for n in ("alpha", "beta")])
+            assert "◆" in str(task_list.get_option("beta").prompt)
+            assert "◆" not in str(task_list.get_option("alpha").prompt)
+
+    async def test_refresh_keeps_selected_task(self, app, tmp_path):
+        """Refreshing follows the selected task, or keeps its position if it went."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            task_list = app.query_one("#task-list", TaskList)
+
+            tasks = [Task(name=n, path=tmp_path / n) for n in ("beta", "delta", "gamma")]
+            task_list.load_tasks(tasks)
+            task_list.highlighted = 1  # delta
+            await pilot.pause()
+
+            task_list.refresh_tasks([*tasks, Task(name="alpha", path=tmp_path / "alpha")])
+            await pilot.pause()
+            assert task_list.get_selected_task().name == "delta"
+            assert task_list.highlighted == 2
+
+            task_list.refresh_tasks([t for t in task_list.tasks if t.name != "delta"])
+            await pilot.pause()
+            assert task_list.highlighted == 2
+            assert task_list.get_selected_task().name == "gamma"
+
+    async def test_load_tasks_uses_precomputed_row_states(self, app, tmp_path):
+        """Row labels handed in from a worker are used instead of disk reads."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            task_list = app.query_one("#task-list", TaskList)
+
+            tasks = [Task(name="raw-name", path=tmp_path / "raw-name")]
+            task_list.load_tasks(tasks, row_states={"raw-name": ("Alias", True)})
+            await pilot.pause()
+
+            prompt = str(task_list.get_option_at_index(0).prompt)
+            assert "Alias" in prompt
+            assert "◆" in prompt
+
+    def test_sort_mode_cycle_visits_every_mode(self):
+        """Sort cycling walks every mode in order, each with its own label."""
+        task_list = TaskList()
+        labels = []
+        for _ in SortMode:
+            labels.append(task_list.get_sort_label())
+            task_list.cycle_sort_mode()
+        assert task_list._sort_mode is SortMode.NAME_ASC
+        assert labels[:2] == ["by name ↑", "by name ↓"]
+        assert len(set(labels)) == len(SortMode)
+
+    def test_messages_are_slotted(self):
+        """Per-keystroke list messages carry no per-instance __dict__."""
+        messages = [
+            TaskList.TaskHighlighted(None),
+            TaskList.SortModeChanged(SortMode.NAME_ASC, "by name ↑"),
+            WorktreeList.WorktreeHighlighted(None),
+            WorktreeList.GroupingChanged(True),
+        ]
+        assert not any(hasattr(message, "__dict__") for message in messages)
+
+    def test_date_sort_orders_by_mtime(self, tmp_path):
+        """Date sorting uses directory mtimes, treating missing dirs as oldest."""
+        for name, mtime in (("old", 1_000), ("new", 2_000)):
+            (tmp_path / name).mkdir()
+            os.utime(tmp_path / name, (mtime, mtime))
+        tasks = [Task(name=n, path=tmp_path / n) for n in ("old", "gone", "new")]
+
+        task_list = TaskList()
+        task_list._sort_mode = SortMode.DATE_NEWEST
+        assert [t.name for t in task_list._sort_tasks(tasks)] == ["new", "old", "gone"]
+        task_list._sort_mode = SortMode.DATE_OLDEST
+        assert [t.name for t in task_list._sort_tasks(tasks)] == ["gone", "old", "new"]
+
+    def test_status_sort_breaks_ties_by_lowercased_name(self, tmp_path):
+        """Status sorting groups by dirtiness, then orders names case-insensitively."""
+        dirty = Worktree("repo", tmp_path, is_dirty=True)
+        tasks = [
+            Task(name="beta", path=tmp_path / "beta"),
+            Task(name="Zed", path=tmp_path / "zed", worktrees=[dirty]),
+            Task(name="Alpha", path=tmp_path / "alpha"),
+            Task(name="apex", path=tmp_path / "apex", worktrees=[dirty]),
+        ]
+
+        task_list = TaskList()
+        task_list._sort_mode = SortMode.STATUS_DIRTY
+        assert [t.name for t in task_list._sort_tasks(tasks)] == ["apex", "Zed", "Alpha", "beta"]
+        task_list._sort_mode = SortMode.STATUS_CLEAN
+        assert [t.name for t in task_list._sort_tasks(tasks)] == ["Alpha", "beta", "apex", "Zed"]
+        assert tasks[1].name_lower == "zed"
+
 
 class TestWorktreeListWidget:
     """Tests for WorktreeList widget."""
@@ -166,6 +397,35 @@ class TestWorktreeListWidget:
             worktree_list = app.query_one("#worktree-list", WorktreeList)
             assert len(worktree_list.worktrees) == 2
 
+    async def test_grouped_rows_map_to_worktrees(self, app, tmp_path):
+        """Grouped rows (headers and separator included) select the right worktree."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            worktree_list = app.query_one("#worktree-list", WorktreeList)
+
+            worktrees = [
+                Worktree("clean-a", tmp_path / "a"),
+                Worktree("dirty", tmp_path / "d", is_dirty=True, changed_files=2),
+                Worktree("clean-b", tmp_path / "b"),
+            ]
+            worktree_list.toggle_grouping()
+            worktree_list.load_worktrees(worktrees)
+
+            # Dirty header, dirty, Clean header, clean-a, clean-b
+            assert worktree_list.option_count == 5
+            assert worktree_list._option_to_worktree == [-1, 1, -1, 0, 2]
+            for index, name in ((1, "dirty"), (3, "clean-a"), (4, "clean-b")):
+                worktree_list.highlighted = index
+                assert worktree_list.get_selected_worktree().name == name
+                assert worktree_list.get_option_at_index(index).id == name
+
+            # Toggling back re-lays out the same list with the same widths
+            prompt = str(worktree_list.get_option("clean-a").prompt)
+            worktree_list.toggle_grouping()
+            assert worktree_list.worktrees is worktrees
+            assert worktree_list.option_count == 3
+            assert str(worktree_list.get_option("clean-a").prompt) == prompt
+
 
 class TestNewTaskAction:
     """Tests for the new_task action."""
@@ -649,13 +909,11 @@ class TestShiftTabNavigation:
 class TestAppConfiguration:
     """Tests for app configuration."""
 
-    async def test_app_applies_theme(self, app):
+    @shared_app
+    async def test_app_applies_theme(self, running_app):
         """Test that app applies theme from config."""
-        async with app.run_test() as pilot:
-            await pilot.pause()
-
-            # App should have loaded without errors
-            assert app.is_running
+        # App should have loaded without errors
+        assert running_app.is_running
 
     async def test_custom_keybindings_loaded(self, app):
         """Test that custom keybindings are loaded from config."""
@@ -1,8 +1,14 @@
 """Tests for Claude Code hook and settings configuration."""
 
 import json
+import os
+import shlex
+import stat
+import subprocess
 from pathlib import Path
 
+import pytest
+
 from tasktree_manager.services.claude_hooks import (
     ensure_claude_hooks,
     ensure_worktree_claude_settings,
@@ -137,6 +143,84 @@ class TestEnsureClaudeHooks:
         assert weird_group in settings["hooks"]["Stop"]
         assert ".claude_status" in json.dumps(settings["hooks"]["Stop"])
 
+    def test_hook_command_quotes_status_path(self, tmp_path):
+        """The hook command writes JSON status to the shell-quoted file path."""
+        task_path = tmp_path / "it's"
+        task_path.mkdir()
+        ensure_claude_hooks(task_path)
+
+        settings = json.loads((task_path / ".claude" / "settings.local.json").read_text())
+        command = settings["hooks"]["Stop"][0]["hooks"][0]["command"]
+        quoted_path = shlex.quote(str(task_path / ".claude_status"))
+        assert command == (
+            f"""printf '{{"status":"waiting","ts":%d}}' ${{EPOCHSECONDS:-$(date +%s)}}"""
+            f""" > {quoted_path}"""
+        )
+
+    def test_hook_command_writes_status_json(self, tmp_path):
+        """Run under sh, the hook command writes a parseable status record."""
+        ensure_claude_hooks(tmp_path)
+        settings = json.loads((tmp_path / ".claude" / "settings.local.json").read_text())
+        command = settings["hooks"]["SessionEnd"][0]["hooks"][0]["command"]
+
+        subprocess.run(["sh", "-c", command], check=True)
+
+        record = json.loads((tmp_path / ".claude_status").read_text())
+        assert record["status"] == "ended"
+        assert isinstance(record["ts"], int) and record["ts"] > 0
+
+    def test_unchanged_settings_are_not_rewritten(self, tmp_path):
+        """Re-ensuring identical hooks leaves the file untouched."""
+        ensure_claude_hooks(tmp_path, "/shared/memory")
+        settings_file = tmp_path / ".claude" / "settings.local.json"
+        os.utime(settings_file, (1_000, 1_000))
+
+        ensure_claude_hooks(tmp_path, "/shared/memory")
+        assert settings_file.stat().st_mtime == 1_000
+
+        ensure_claude_hooks(tmp_path, "/other/memory")
+        assert settings_file.stat().st_mtime != 1_000
+
+    def test_write_is_atomic_json(self, tmp_path):
+        """The settings file is renamed into place as indented JSON."""
+        ensure_claude_hooks(tmp_path, "/shared/memory")
+        settings_file = tmp_path / ".claude" / "settings.local.json"
+        written = settings_file.read_text()
+
+        assert written == json.dumps(json.loads(written), indent=2) + "\n"
+        assert [p.name for p in settings_file.parent.iterdir()] == ["settings.local.json"]
+
+    def test_write_goes_through_symlink_and_keeps_mode(self, tmp_path):
+        """A symlinked settings file stays a symlink; its target keeps its mode."""
+        dotfiles = tmp_path / "dotfiles"
+        dotfiles.mkdir()
+        target = dotfiles / "settings.local.json"
+        target.write_text("{}\n")
+        target.chmod(0o600)
+        claude_dir = tmp_path / "wt" / ".claude"
+        claude_dir.mkdir(parents=True)
+        settings_file = claude_dir / "settings.local.json"
+        settings_file.symlink_to(target)
+
+        ensure_claude_hooks(tmp_path / "wt", "/shared/memory")
+
+        assert settings_file.is_symlink()
+        assert "hooks" in json.loads(target.read_text())
+        assert stat.S_IMODE(target.stat().st_mode) == 0o600
+        assert sorted(p.name for p in dotfiles.iterdir()) == ["settings.local.json"]
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        """A write that fails before the rename cleans up its temp file."""
+
+        def failing_replace(self, target):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(Path, "replace", failing_replace)
+        with pytest.raises(OSError, match="disk full"):
+            ensure_claude_hooks(tmp_path, "/shared/memory")
+
+        assert list((tmp_path / ".claude").iterdir()) == []
+
 
 class TestRepoMemoryDir:
     """Tests for repo_memory_dir."""
@@ -249,3 +249,40 @@ class TestMessagesPanelIntegration:
             pilot.app._log_activity("Error message", MessageLevel.ERROR)
 
             assert messages_display.message_count == 4
+
+    async def test_display_newest_first_and_capped(self, app):
+        """Rendered log lists newest first and drops lines past the cap."""
+        async with app.run_test() as pilot:
+            await pilot.press("m")
+            await pilot.pause()
+            messages_display = pilot.app.query_one("#messages-display", MessagesPanel)
+            messages_display.clear_messages()
+            cap = messages_display._store.max_messages
+
+            for i in range(cap + 2):
+                messages_display.add_message(f"msg {i}", MessageLevel.INFO)
+
+            lines = messages_display.content.plain.splitlines()
+            assert len(lines) == cap
+            assert lines[0].endswith(f"msg {cap + 1}")
+            assert lines[-1].endswith("msg 2")
+
+            messages_display.clear_messages()
+            assert messages_display.content.plain == "No recent activity"
+
+    async def test_hidden_panel_defers_render_until_shown(self, app):
+        """Messages logged while hidden are rendered when the panel is shown."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            messages_display = pilot.app.query_one("#messages-display", MessagesPanel)
+            messages_display.clear_messages()
+            messages_display.add_message("while hidden", MessageLevel.INFO)
+
+            assert messages_display._dirty
+            assert "while hidden" not in str(messages_display.content)
+
+            await pilot.press("m")
+            await pilot.pause()
+
+            assert not messages_display._dirty
+            assert messages_display.content.plain.endswith("while hidden")
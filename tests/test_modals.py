@@ -89,14 +89,79 @@ class TestCreateTaskModal:
             app.push_screen(modal)
             await pilot.pause()
 
-            # Set the Input value, which posts Input.Changed -> on_input_changed.
+            # Set the Input value, which posts Input.Changed -> on_input_changed;
+            # the filter runs once the debounce interval has passed.
             search = modal.query_one("#repo-search", Input)
             search.value = "mdp"
-            await pilot.pause()
+            await pilot.pause(CreateTaskModal.FILTER_DEBOUNCE + 0.1)
 
             repo_list = modal.query_one("#repo-list", SelectionList)
             assert _visible_values(repo_list) == ["mdp/terraform"]
 
+    async def test_search_keystroke_burst_filters_once(self, app, sample_repos, monkeypatch):
+        """Rapid search edits are debounced into a single rebuild of the list."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            modal = CreateTaskModal(available_repos=["mdp/terraform", "mdp/docs", "airflow"])
+            app.push_screen(modal)
+            await pilot.pause()
+
+            repo_list = modal.query_one("#repo-list", SelectionList)
+            rebuilds: list[list[str]] = []
+            original = repo_list.add_options
+
+            def tracking_add_options(items):
+                rebuilds.append([item.value for item in items])
+                return original(items)
+
+            monkeypatch.setattr(repo_list, "add_options", tracking_add_options)
+            search = modal.query_one("#repo-search", Input)
+            for value in ("m", "md", "mdp", "mdp/d"):
+                search.value = value
+                await pilot.pause()
+            await pilot.pause(CreateTaskModal.FILTER_DEBOUNCE + 0.1)
+
+            # One rebuild, straight to the final term's matches
+            assert rebuilds == [["mdp/docs"]]
+            assert _visible_values(repo_list) == ["mdp/docs"]
+
+    async def test_search_broadening_after_narrowing(self, app, sample_repos):
+        """Deleting characters after a narrow search brings back wider matches."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            modal = CreateTaskModal(available_repos=["mdp/docs", "mdp/gitops", "ansible"])
+            app.push_screen(modal)
+            await pilot.pause()
+
+            modal._filter_repos("mdp")
+            modal._filter_repos("mdp/g")
+            modal._filter_repos("p/")
+            await pilot.pause()
+
+            repo_list = modal.query_one("#repo-list", SelectionList)
+            assert _visible_values(repo_list) == ["mdp/docs", "mdp/gitops"]
+
+    async def test_search_unchanged_term_skips_rebuild(self, app, sample_repos):
+        """A term that normalizes to the current one leaves the list untouched."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            modal = CreateTaskModal(available_repos=["mdp/docs", "mdp/gitops", "ansible"])
+            app.push_screen(modal)
+            await pilot.pause()
+
+            modal._filter_repos("mdp")
+            repo_list = modal.query_one("#repo-list", SelectionList)
+            option = repo_list.get_option_at_index(0)
+
+            modal._filter_repos(" MDP ")
+            await pilot.pause()
+
+            assert repo_list.get_option_at_index(0) is option
+            assert _visible_values(repo_list) == ["mdp/docs", "mdp/gitops"]
+
     async def test_search_preserves_selections(self, app, sample_repos):
         """Test that search preserves previously selected repos."""
         async with app.run_test() as pilot:
@@ -223,6 +288,30 @@ class TestCreateTaskModal:
             # Modal should not have dismissed
             assert modal in app.screen_stack
 
+    async def test_create_button_gated_on_name_and_selection(self, app, sample_repos):
+        """Create stays disabled until a name is typed and a repo is selected."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            modal = CreateTaskModal(available_repos=["repo-a", "repo-b"])
+            app.push_screen(modal)
+            await pilot.pause()
+
+            create_btn = modal.query_one("#create-btn", Button)
+            assert create_btn.disabled
+
+            modal.query_one("#task-name", Input).value = "TEST-123"
+            await pilot.pause()
+            assert create_btn.disabled
+
+            modal.query_one("#repo-list", SelectionList).select("repo-a")
+            await pilot.pause()
+            assert not create_btn.disabled
+
+            modal.query_one("#task-name", Input).value = "   "
+            await pilot.pause()
+            assert create_btn.disabled
+
     async def test_cancel_dismisses_modal(self, app, sample_repos):
         """Test that cancel button dismisses modal."""
         async with app.run_test() as pilot:
@@ -395,6 +484,19 @@ class TestSafeDeleteModal:
             # Modal should compose without error
             assert modal in app.screen_stack
 
+    def test_warnings_sections_in_order(self, safety_report_with_issues):
+        """Only non-empty sections are listed, in display order."""
+        modal = SafeDeleteModal(task_name="TEST", safety_report=safety_report_with_issues)
+        lines = modal._warnings_content.splitlines()
+
+        headers = [line for line in lines if line.startswith("[bold")]
+        assert headers == [
+            "[bold red]Unpushed commits:[/]",
+            "[bold red]Unmerged branches:[/]",
+            "[bold red]Uncommitted changes:[/]",
+        ]
+        assert "  * repo-a (3 commits ahead)" in lines
+
     async def test_push_button_dismisses(self, app, sample_repos):
         """Test that Push All button dismisses modal."""
         async with app.run_test() as pilot:
@@ -565,6 +667,17 @@ class TestHelpModal:
         assert "General" in content
         assert "Tips" in content
 
+    def test_help_content_cached_across_instances(self, monkeypatch):
+        """Reopening help with the same keybindings reuses the built content."""
+        keybindings = {"quit": "ctrl+q", "help": "F1"}
+        first = HelpModal(keybindings=keybindings)._cached_help_content()
+
+        def fail(self):
+            raise AssertionError("help content rebuilt")
+
+        monkeypatch.setattr(HelpModal, "_build_help_content", fail)
+        assert HelpModal(keybindings=dict(keybindings))._cached_help_content() == first
+
 
 class TestEscapeDismissesModals:
     """Escape cancels modals with the same result as the Cancel button."""
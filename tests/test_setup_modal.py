@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from textual.widgets import Button, Input
+from textual.widgets import Button, Input, Static
 
 from tasktree_manager.widgets.setup_modal import SetupModal
 
@@ -62,6 +62,7 @@ class TestSetupModal:
 
             # Try to save
             modal._save_config()
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             # Modal should still be there (validation failed)
@@ -91,6 +92,7 @@ class TestSetupModal:
 
             # Try to save
             modal._save_config()
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             # Modal should still be there (validation failed)
@@ -124,12 +126,33 @@ class TestSetupModal:
 
             # Try to save
             modal._save_config()
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             # Modal should still be there (validation failed)
             assert modal in app.screen_stack
             assert modal.error_message != ""
 
+    async def test_valid_paths_dismiss_with_result(self, app, tmp_path):
+        """Test that valid paths are validated off-thread and returned."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            results = []
+            modal = SetupModal()
+            app.push_screen(modal, results.append)
+            await pilot.pause()
+
+            modal.query_one("#repos-dir", Input).value = str(tmp_path)
+            modal.query_one("#tasks-dir", Input).value = str(tmp_path / "tasks")
+
+            modal._save_config()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert results == [(tmp_path, tmp_path / "tasks")]
+            assert modal not in app.screen_stack
+
     async def test_cancel_dismisses_modal(self, app, sample_repos):
         """Test that cancel button dismisses modal."""
         async with app.run_test() as pilot:
@@ -169,11 +192,37 @@ class TestSetupModal:
 
             # Try to save
             modal._save_config()
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             # Should have error message
             assert modal.error_message != ""
 
+    async def test_validation_error_shown_in_place(self, app, sample_repos, tmp_path):
+        """Test that errors appear without rebuilding the form."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            modal = SetupModal()
+            app.push_screen(modal)
+            await pilot.pause()
+
+            error_widget = modal.query_one("#error-message", Static)
+            assert not error_widget.display
+
+            repos_input = modal.query_one("#repos-dir", Input)
+            repos_input.value = str(tmp_path / "nonexistent_repos")
+
+            modal._save_config()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            # Same widgets, typed value kept, error now visible
+            assert modal.query_one("#repos-dir", Input) is repos_input
+            assert repos_input.value == str(tmp_path / "nonexistent_repos")
+            assert error_widget.display
+            assert "does not exist" in str(error_widget.content)
+
     def test_welcome_text_defined(self):
         """Test that welcome text is defined."""
         modal = SetupModal()
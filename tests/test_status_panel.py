@@ -4,7 +4,7 @@ import pytest
 
 from tasktree_manager.services.git_ops import GitStatus
 from tasktree_manager.services.task_manager import Worktree
-from tasktree_manager.widgets.status_panel import StatusPanel
+from tasktree_manager.widgets.status_panel import StatusPanel, _style_for_code
 
 
 class TestStatusPanel:
@@ -220,3 +220,136 @@ class TestStatusPanel:
 
             assert panel._worktree_name == ""
             assert panel._status is None
+
+    async def test_identical_status_reuses_render(self, app, sample_worktree):
+        """Re-delivering an equal status reuses the rendered Text."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            panel = app.query_one("#status-display", StatusPanel)
+            panel.update_status(sample_worktree, GitStatus(branch="main", modified=["a.py"]))
+            await pilot.pause(StatusPanel.RENDER_DEBOUNCE + 0.05)
+            first = panel.content
+
+            panel.update_status(sample_worktree, GitStatus(branch="main", modified=["a.py"]))
+            await pilot.pause(StatusPanel.RENDER_DEBOUNCE + 0.05)
+            assert panel.content is first
+
+            # Loading replaces the content; restoring shows the cached render
+            panel.set_loading(True)
+            panel.set_loading(False)
+            assert panel.content is first
+
+            panel.update_status(sample_worktree, GitStatus(branch="main", modified=["b.py"]))
+            await pilot.pause(StatusPanel.RENDER_DEBOUNCE + 0.05)
+            assert panel.content is not first
+            assert "b.py" in panel.content.plain
+
+    async def test_same_status_object_is_not_rescheduled(self, app, sample_worktree):
+        """Re-delivering the displayed status object skips scheduling a render."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            panel = app.query_one("#status-display", StatusPanel)
+            status = GitStatus(branch="main")
+            panel.update_status(sample_worktree, status)
+            await pilot.pause(StatusPanel.RENDER_DEBOUNCE + 0.05)
+
+            panel.update_status(sample_worktree, status)
+            assert panel._render_timer is None
+
+            # After a loading indicator the same status must render again
+            panel.set_loading(True)
+            panel.update_status(sample_worktree, status)
+            assert panel._render_timer is not None
+
+    async def test_fast_status_replaces_loading_in_one_update(
+        self, app, sample_worktree, monkeypatch
+    ):
+        """A status arriving within the debounce window skips the loading frame."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            panel = app.query_one("#status-display", StatusPanel)
+            shown = []
+            original = panel.update
+
+            def tracking_update(content=""):
+                shown.append(content.plain)
+                original(content)
+
+            monkeypatch.setattr(panel, "update", tracking_update)
+            panel.set_loading(True)
+            panel.update_status(sample_worktree, GitStatus(branch="main"))
+            await pilot.pause(StatusPanel.RENDER_DEBOUNCE + 0.05)
+
+            assert "Loading..." not in shown
+            assert len(shown) == 1
+            assert "Branch: main" in shown[0]
+
+    async def test_status_burst_renders_latest_once(self, app, tmp_path, monkeypatch):
+        """Back-to-back status updates coalesce into one render of the last."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            panel = app.query_one("#status-display", StatusPanel)
+            shown = []
+            original = panel.update
+
+            def tracking_update(content=""):
+                shown.append(content.plain)
+                original(content)
+
+            monkeypatch.setattr(panel, "update", tracking_update)
+            for i in range(5):
+                worktree = Worktree(name=f"repo-{i}", path=tmp_path, branch=f"b{i}")
+                panel.update_status(worktree, GitStatus(branch=f"b{i}"))
+            await pilot.pause(StatusPanel.RENDER_DEBOUNCE + 0.05)
+
+            assert len(shown) == 1
+            assert "Repository: repo-4" in shown[0]
+            assert "Branch: b4" in shown[0]
+            assert panel.content.plain == shown[0]
+
+    async def test_loading_supersedes_pending_render(self, app, sample_worktree):
+        """An immediate loading indicator is not overwritten by a stale render."""
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            panel = app.query_one("#status-display", StatusPanel)
+            panel.update_status(sample_worktree, GitStatus(branch="main"))
+            panel.set_loading(True)
+            await pilot.pause(StatusPanel.RENDER_DEBOUNCE + 0.05)
+
+            assert panel.content.plain == "Loading..."
+
+
+@pytest.mark.parametrize(
+    ("code", "color", "bold", "name_red"),
+    [
+        ("UU", "red", True, True),
+        ("AA", "red", True, True),
+        ("??", "red", None, True),
+        (" D", "red", None, True),
+        (" M", "yellow", None, False),
+        ("R ", "green", None, False),
+        ("A ", "green", None, False),
+    ],
+)
+def test_style_for_code(code, color, bold, name_red):
+    """Status codes map to the same styles via the precomputed table."""
+    code_style, name_style = _style_for_code(code)
+    assert code_style.color.name == color
+    assert code_style.bold is bold
+    assert (name_style.color is not None) is name_red
+
+
+def test_clean_worktree_text_shared():
+    """Clean, in-sync worktrees reuse one rendered Text per name and branch."""
+    panel = StatusPanel()
+    panel._worktree_name = "repo"
+    first = panel._build_worktree_text(GitStatus(branch="main"))
+
+    assert panel._build_worktree_text(GitStatus(branch="main")) is first
+    assert first.plain.endswith("working tree clean")
+    assert panel._build_worktree_text(GitStatus(branch="main", ahead=1)) is not first
@@ -1,10 +1,19 @@
 """Tests for the task manager service."""
 
+import os
 import subprocess
+from pathlib import Path
 
 import pytest
 
-from tasktree_manager.services.task_manager import RepoIssue, Task, TaskSafetyReport, Worktree
+from tasktree_manager.services.task_manager import (
+    RepoIssue,
+    Task,
+    TaskSafetyReport,
+    Worktree,
+    _read_common_git_dir,
+    validate_task_name,
+)
 
 
 class TestTaskManager:
@@ -46,6 +55,64 @@ class TestTaskManager:
         assert len(tasks) == 1
         assert tasks[0].name == "TASK-1"
 
+    def test_list_tasks_captures_mtime(self, task_manager, sample_repo):
+        """Listed tasks carry their directory mtime for date sorting."""
+        repo_path, branch = sample_repo
+        task = task_manager.create_task("TASK-1", ["sample-repo"], branch)
+
+        listed = task_manager.list_tasks()[0]
+        assert listed.mtime == task.path.stat().st_mtime
+
+    def test_worktree_scan_stops_at_worktrees(self, config, task_manager, monkeypatch):
+        """Worktrees (dirs with a .git file) are found without walking into them."""
+        task_path = config.tasks_dir / "SCAN"
+        for rel in ("api", "group/web", "api/vendored-sub", "node_modules/pkg"):
+            (task_path / rel).mkdir(parents=True)
+            (task_path / rel / ".git").write_text("gitdir: /nowhere\n")
+        (task_path / "notes").mkdir()
+
+        scans = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(
+            "tasktree_manager.services.task_manager.os.scandir",
+            lambda path: scans.append(path) or real_scandir(path),
+        )
+        worktrees = task_manager.get_task("SCAN").worktrees
+
+        assert [(w.name, w.path) for w in worktrees] == [
+            ("api", task_path / "api"),
+            ("group/web", task_path / "group" / "web"),
+        ]
+        # Only non-worktree directories are listed, never a checkout
+        assert sorted(scans) == sorted(str(task_path / rel) for rel in ("", "group", "notes"))
+
+    def test_worktree_scan_is_cached_until_a_directory_changes(
+        self, config, task_manager, monkeypatch
+    ):
+        """Unchanged task trees are not re-listed; new worktrees are picked up."""
+        task_path = config.tasks_dir / "CACHED"
+        for rel in ("api", "group/web"):
+            (task_path / rel).mkdir(parents=True)
+            (task_path / rel / ".git").write_text("gitdir: /nowhere\n")
+        first = task_manager.get_task("CACHED").worktrees
+
+        scans = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(
+            "tasktree_manager.services.task_manager.os.scandir",
+            lambda path: scans.append(path) or real_scandir(path),
+        )
+        second = task_manager.get_task("CACHED").worktrees
+        assert scans == []
+        assert [w.name for w in second] == ["api", "group/web"]
+        assert second[0] is not first[0]
+
+        (task_path / "group" / "cli").mkdir()
+        (task_path / "group" / "cli" / ".git").write_text("gitdir: /nowhere\n")
+        os.utime(task_path / "group", ns=(0, 0))  # coarse-mtime filesystems
+        third = task_manager.get_task("CACHED").worktrees
+        assert [w.name for w in third] == ["api", "group/cli", "group/web"]
+
     def test_get_task(self, task_manager, sample_repo):
         """Test getting a specific task."""
         repo_path, branch = sample_repo
@@ -94,6 +161,15 @@ class TestTaskManager:
         with pytest.raises(ValueError, match="Repository not found"):
             task_manager.create_task("FAIL-TASK", ["nonexistent-repo"], "main")
 
+    def test_create_task_sets_up_every_repo_before_raising(self, task_manager, sample_repos):
+        """A failing repo does not stop the others; the failure is still raised."""
+        repos, branch = sample_repos
+        with pytest.raises(ValueError, match="Repository not found: missing"):
+            task_manager.create_task("MIXED", ["missing", "repo-alpha", "repo-beta"], branch)
+
+        task = task_manager.get_task("MIXED")
+        assert [wt.name for wt in task.worktrees] == ["repo-alpha", "repo-beta"]
+
 
 class TestTaskNameValidation:
     """Tests for task name safety validation."""
@@ -121,6 +197,11 @@ class TestTaskNameValidation:
         with pytest.raises(ValueError, match="can only contain"):
             task_manager.create_task("bad name[1]", [], "main")
 
+    @pytest.mark.parametrize("name", ["trailing\n", "caf\u00e9", "\u0661\u0662"])
+    def test_rejects_non_ascii_and_newlines(self, name):
+        """Only the ASCII name characters pass, with no trailing newline."""
+        assert "can only contain" in validate_task_name(name)
+
     def test_accepts_normal_names(self, task_manager, sample_repo):
         """Ordinary ticket-style names still work, including subdirectories."""
         _, branch = sample_repo
@@ -381,6 +462,35 @@ class TestSafetyChecks:
         assert report.is_safe()
         assert not report.unmerged
 
+    def test_default_branch_read_from_origin_head(
+        self, task_manager, config, repo_with_origin, monkeypatch
+    ):
+        """origin/HEAD is read from disk; without it git is asked every time."""
+        from tasktree_manager.services.git_ops import GitOps
+
+        base = repo_with_origin
+        task = task_manager.create_task("BRANCH-TASK", ["repo-remote"], base)
+        worktree = task.worktrees[0]
+
+        # No origin/HEAD yet: each lookup goes to git, so a failed one
+        # (falling back to "main") is not remembered
+        answers = iter(["main", base])
+        monkeypatch.setattr(GitOps, "get_default_branch", staticmethod(lambda wt: next(answers)))
+        assert task_manager._get_default_branch(worktree) == "main"
+        assert task_manager._get_default_branch(worktree) == base
+
+        def unexpected(wt):
+            raise AssertionError("origin/HEAD should answer without git")
+
+        monkeypatch.setattr(GitOps, "get_default_branch", staticmethod(unexpected))
+        subprocess.run(
+            ["git", "remote", "set-head", "origin", base],
+            cwd=config.repos_dir / "repo-remote",
+            capture_output=True,
+            check=True,
+        )
+        assert task_manager._get_default_branch(worktree) == base
+
 
 class TestStatusErrorSafety:
     """A failed git status must block deletion, never pass as clean."""
@@ -674,6 +784,24 @@ class TestTaskManagerEdgeCases:
         # Should still have same number (already exists)
         assert len(task.worktrees) == initial_count
 
+    def test_read_common_git_dir_matches_git(self, task_manager, sample_repo, tmp_path):
+        """The on-disk gitdir pointer resolves to the same dir git reports."""
+        repo_path, branch = sample_repo
+        task = task_manager.create_task("COMMON-DIR", ["sample-repo"], branch)
+        worktree_path = task.worktrees[0].path
+
+        reported = subprocess.run(
+            ["git", "rev-parse", "--path-format=absolute", "--git-common-dir"],
+            cwd=worktree_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        assert _read_common_git_dir(worktree_path) == Path(reported).resolve()
+        # Not a linked worktree: left to git
+        assert _read_common_git_dir(repo_path) is None
+        assert _read_common_git_dir(tmp_path / "missing") is None
+
     def test_finish_task_cleans_worktrees(self, task_manager, sample_repos):
         """Test that finish_task removes worktrees properly."""
         repos, branch = sample_repos
@@ -689,6 +817,25 @@ class TestTaskManagerEdgeCases:
         # Verify task directory is gone
         assert not task.path.exists()
 
+        # Every repo had its worktree unregistered and task branch deleted
+        for repo_path in repos[:2]:
+            branches = subprocess.run(
+                ["git", "branch", "--list", "FINISH-TEST"],
+                cwd=repo_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            assert branches == ""
+            worktrees = subprocess.run(
+                ["git", "worktree", "list", "--porcelain"],
+                cwd=repo_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            assert "FINISH-TEST" not in worktrees
+
     def test_get_repos_not_in_task_all_used(self, task_manager, sample_repo):
         """Test get_repos_not_in_task when all repos are used."""
         repo_path, branch = sample_repo
@@ -870,6 +1017,21 @@ class TestGitignoreSymlinks:
 
         assert (worktree_path / "conf" / "api.secret").is_symlink()
 
+    def test_symlinks_leave_existing_broken_links(self, task_manager, sample_repo):
+        """A dangling symlink already at the link path is kept, not an error."""
+        repo_path, branch = sample_repo
+        (repo_path / ".gitignore").write_text(".env\n")
+        (repo_path / ".env").write_text("SECRET=value\n")
+
+        task = task_manager.create_task("BROKEN-LINK", ["sample-repo"], branch)
+        worktree_env = task.worktrees[0].path / ".env"
+        worktree_env.unlink()
+        worktree_env.symlink_to(repo_path / "gone")
+
+        task_manager._create_gitignore_symlinks(repo_path, task.worktrees[0].path)
+
+        assert os.readlink(worktree_env) == str(repo_path / "gone")
+
     def test_symlinks_skip_claude_settings(self, task_manager, sample_repo):
         """Files under .claude are never symlinked: tasktree writes its own
         worktree settings there, and a symlink would redirect those writes
@@ -1095,6 +1257,33 @@ class TestWorktreeBaseFreshness:
             "worktree must be based on origin/master, not the stale local master"
         )
 
+    def test_worktree_uses_remote_base_outside_fetch_refspec(self, config, task_manager):
+        """A single-branch clone has no origin/<base> until tasktree fetches
+        it; the fetch must create it rather than rely on the remote's refspec."""
+        upstream = config.repos_dir.parent / "upstream-single"
+        upstream.mkdir()
+        self._git("init", "-q", "-b", "master", cwd=upstream)
+        self._git("config", "user.email", "test@example.com", cwd=upstream)
+        self._git("config", "user.name", "Test", cwd=upstream)
+        self._make_commit(upstream, "base.txt", "base")
+        self._git("branch", "release", cwd=upstream)
+
+        clone = config.repos_dir / "single-repo"
+        self._git(
+            "clone",
+            "-q",
+            "--single-branch",
+            "-b",
+            "release",
+            str(upstream),
+            str(clone),
+            cwd=config.repos_dir,
+        )
+
+        task = task_manager.create_task("FRESH-3", ["single-repo"], "master")
+
+        assert (task.path / "single-repo" / "base.txt").exists()
+
     def test_worktree_falls_back_to_local_base_without_remote(
         self, config, task_manager, sample_repo
     ):
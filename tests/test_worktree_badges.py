@@ -1,8 +1,10 @@
 """Tests for worktree badge rendering and the agent/forge poll plumbing."""
 
+from rich.text import Text
+
 from tasktree_manager.services.forge import ForgeStatus
 from tasktree_manager.widgets.messages_panel import MessagesPanel
-from tasktree_manager.widgets.worktree_list import WorktreeList
+from tasktree_manager.widgets.worktree_list import WorktreeList, _row_columns
 
 
 def _worktree_prompt(worktree_list: WorktreeList, name: str) -> str:
@@ -77,6 +79,14 @@ class TestWorktreeBadges:
             worktree_list.refresh_status_badges({"/no/such/path": "working"}, {})
             assert "⟳" not in _worktree_prompt(worktree_list, "repo-alpha")
 
+    def test_row_columns_pad_before_escaping(self):
+        columns = _row_columns("repo", "fix[wip]", 6, 10)
+        assert columns == "repo    [dim]fix\\[wip]  [/]"
+        # Brackets show literally and the columns keep their display widths
+        rendered = Text.from_markup(_row_columns("api[v2]", "fix[wip]", 8, 10))
+        assert rendered.plain == "api[v2]   fix[wip]  "
+        assert [span.style for span in rendered.spans] == ["dim"]
+
 
 class TestAgentPollPlumbing:
     async def test_apply_agent_sessions_pushes_badges(self, app, task_manager, sample_repos):